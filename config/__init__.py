@@ -1,3 +1,3 @@
-from .loaders import Config_Loader
+from .loaders import Config_Loader, get_settings
 
-__all__ = ["Config_Loader"]
\ No newline at end of file
+__all__ = ["Config_Loader", "get_settings"]
\ No newline at end of file
@@ -1,28 +1,40 @@
-from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from dotenv import load_dotenv
+from functools import lru_cache
 from pathlib import Path
 from src import CONFIG_PATH
 import os, yaml
 
+# C-backed YAML parser when PyYAML was built with libyaml
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 # Carica variabili d'ambiente
 load_dotenv()
 
 class ExecutionConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     max_retries: int
     backoff_sec: float
     scan: str
+    max_concurrency: int = 4  # datasets processed at the same time
 
 class IOConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     queries_dir: Path
     prompts_dir: Path
     outputs_dir: Path
 
 class LoggingConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     level: str
     json_format: bool
 
 class GeminiConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     model: str
     temperature: float
     max_output_tokens: int
@@ -31,15 +43,18 @@ class GeminiConfig(BaseModel):
 
 
 class GrokConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     model: str
     max_tokens: int
     api_key: str | None = Field(default=None, env="XAI_API_KEY")
     api_endpoint: str | None = Field(default=None, env="XAI_URL")
 
 class DatasetConfig(BaseModel):
+    model_config = ConfigDict(frozen=True)
     run: str
     
 class AppConfig(BaseSettings):
+    model_config = SettingsConfigDict(frozen=True)
     database: DatasetConfig
     execution: ExecutionConfig
     io: IOConfig
@@ -58,9 +73,17 @@ class Config_Loader:
             raise FileNotFoundError(f"File di configurazione non trovato: {self.config_path}")
 
         with open(self.config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=YamlLoader)
 
         return AppConfig(**data)  
 
     def get_config(self) -> AppConfig:
         return self.config
+
+
+@lru_cache(maxsize=1)
+def get_settings(config_path: str | Path = str(CONFIG_PATH)) -> AppConfig:
+    """
+    Parse and validate config.yaml once; later calls return the same (frozen) AppConfig.
+    """
+    return Config_Loader(config_path).get_config()
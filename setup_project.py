@@ -1,11 +1,11 @@
 from pathlib import Path
-import sys, subprocess, os
+import sys, subprocess
 
 ROOT = Path(__file__).resolve().parent
 VENV = ROOT / ".venv"
 REQS_PATH = ROOT / "requirements.txt"
 
-if(os.name == "nt"):
+if sys.platform == "win32":
     PIP = VENV / "Scripts" / "pip"
     PY  = VENV / "Scripts" / "python"
 else:
@@ -1,10 +1,12 @@
 from .db_connection import connect_to_duckdb
 from .duckdb_db_graphdb import db_creation
 from .run_queries_to_json import load_queries_from_folder, execute_queries_and_save_json
+from .sql_splitter import iter_sql_statements
 
 __all__ = [
     "connect_to_duckdb",
     "db_creation",
     "load_queries_from_folder",
     "execute_queries_and_save_json",
+    "iter_sql_statements",
 ]
\ No newline at end of file
@@ -1,6 +1,5 @@
 # config/db_connection.py
 
-import duckdb
 import os
 from src.utils import DATA_DIR
 from src.utils.logging_config import logger
@@ -44,7 +43,8 @@ def connect_to_duckdb(dataset_name: str):
         logger.error(msg)
         raise FileNotFoundError(msg)
 
-    # Create connection
+    # Create connection (DuckDB is imported on first use, not when src.db is imported)
+    import duckdb
     con = duckdb.connect(database=db_path, read_only=False)
     logger.info(f"DuckDB connection established → {db_path}")
     return con
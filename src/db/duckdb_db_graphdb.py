@@ -1,7 +1,7 @@
-from src.utils import LOG, DATASETS, DATA_DIR
+from src.utils import LOG, DATASETS, DATASETS_SET, DATA_DIR
 from pathlib import Path
 
-import duckdb, os, glob, time, sys
+import os, glob, time, sys
 
 # Function for creating tables and loading data using the "ingest_'foldername'.sql"
 def execute_ingest_sql(con, folder_path: str):
@@ -10,41 +10,40 @@ def execute_ingest_sql(con, folder_path: str):
     The ingest_<name>.sql file should contain the SQL query to create the table and load the data.
     """
 
-    cwd = os.getcwd()  # save original cwd
-    os.chdir(folder_path)  # move cwd in the sql file folder
+    # Relative paths in the script (COPY ... FROM 'x.csv') resolve against the dataset folder.
+    # A per-connection setting instead of os.chdir, so datasets can be ingested concurrently.
+    folder = str(Path(folder_path).resolve()).replace("'", "''")
+    con.execute(f"SET file_search_path = '{folder}'")
 
-    try:
-        # Searching for the ingest_<name>.sql file
-        ingest_sql_files = sorted(glob.glob( "ingest_*.sql"))
+    # Searching for the ingest_<name>.sql file
+    ingest_sql_files = sorted(glob.glob(os.path.join(folder_path, "ingest_*.sql")))
 
-        if not ingest_sql_files:
-            LOG.error(f"ingest_<name>.sql file not found in {folder_path}")
-            return
+    if not ingest_sql_files:
+        LOG.error(f"ingest_<name>.sql file not found in {folder_path}")
+        return
 
-        LOG.trace(f"Folder: {folder_path}")
-        for ingest_file in ingest_sql_files:
-            LOG.info(f"Run: {ingest_file}")
-            try:
-                with open(ingest_file, "r", encoding="utf-8") as f:
-                    sql_script = f.read()
-                con.execute(sql_script)
-                con.commit()
-                LOG.info(f"Execution done: {os.path.basename(ingest_file)}")
-            except Exception as e:
-                LOG.error(f"Error in {ingest_file}: {e}")
-    finally:
-        os.chdir(cwd)
+    LOG.trace(f"Folder: {folder_path}")
+    for ingest_file in ingest_sql_files:
+        LOG.info(f"Run: {os.path.basename(ingest_file)}")
+        try:
+            with open(ingest_file, "r", encoding="utf-8") as f:
+                sql_script = f.read()
+            con.execute(sql_script)
+            con.commit()
+            LOG.info(f"Execution done: {os.path.basename(ingest_file)}")
+        except Exception as e:
+            LOG.error(f"Error in {ingest_file}: {e}")
 
 # Select which datasets to process
 def get_selected_datasets(dataset_name: str) -> list[str]:
     if dataset_name is None:
         LOG.info("No provided parameter, default: ALL")
-        return DATASETS
+        return list(DATASETS)
     
     if dataset_name == "ALL":
         LOG.info("Parameter ALL provided, processing all datasets")
-        return DATASETS
-    elif dataset_name in DATASETS:
+        return list(DATASETS)
+    elif dataset_name in DATASETS_SET:
         LOG.info(f"Parameter {dataset_name} provided, processing only this dataset")
         return [dataset_name]
     else:
@@ -87,6 +86,7 @@ def db_creation(dataset_name: str) -> None:
 
         # Create new database
         t0 = time.time()
+        import duckdb  # imported on first use, not when src.db is imported
         con = duckdb.connect(db_path)
         LOG.info("Connection established")
 
@@ -3,20 +3,59 @@ Utilities to export DuckDB execution plans for a SQL query.
 
 - get_explain()           -> {"format":"text", "plan_text": "..."}
 - get_explain_analyze()   -> {"format":"text", "plan_text": "..."}
+- get_explain_json()      -> {"format":"json", "plan": [...]}   (logical plan, json_serialize_plan)
+
+- save_explain_json()     -> writes DuckDB's json_serialize_plan document unchanged
+- store_plans()           -> upserts plan rows into one DuckDB table (results/explain_plans.duckdb)
 
 - save_explain_pair()     -> writes <base>__explain.json and <base>__analyze.json
+
+- close_connections()     -> closes the cached read-only connections (call before rebuilding /
+                             opening a DB read-write in the same process)
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Callable, Dict, Sequence
+import hashlib
 import json
+import threading
 import time
-import duckdb
 import os
 
+if TYPE_CHECKING:
+    import duckdb
+
+try:
+    import orjson  # optional: faster plan JSON (UTF-8 box-drawing chars are then written unescaped)
+except ImportError:
+    orjson = None
+
+from src.utils import ROOT
 from src.utils.logging_config import logger, log_query_event
 
+# On-disk cache of plan texts, so identical statements are explained only once per DB state
+PLAN_CACHE_DIR = ROOT / "results" / ".plan_cache"
+_PLAN_CACHE_VERSION = 2  # bump when the cached plan text format changes
+# In-process memo in front of the disk cache, keyed by the same cache path.
+# Bounded: the oldest entries (e.g. for DB states since rebuilt) are dropped first.
+_PLAN_MEMO: Dict[Path, str] = {}
+_PLAN_MEMO_MAX = 4096
+_PLAN_MEMO_LOCK = threading.Lock()
+
+# EXPLAIN and EXPLAIN ANALYZE of one statement run side by side (see _run_explain_pair)
+_PAIR_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="explain")
+# Output files are written off the calling thread so JSON and TXT writes overlap
+_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="plan-io")
+
+# Output roots (relative to the working directory, as before)
+RESULTS_JSON_ROOT = Path("results") / "explain_result_json"
+RESULTS_TXT_ROOT = Path("results") / "explain_result"
+# Single-table plan store, the alternative to per-statement files (run_explain_plans --store)
+PLAN_STORE_PATH = Path("results") / "explain_plans.duckdb"
+
 
 def _ensure_db(db_path: Path | str) -> Path:
     p = Path(db_path)
@@ -25,132 +64,466 @@ def _ensure_db(db_path: Path | str) -> Path:
         raise FileNotFoundError(f"Database file not found: {p}")
     return p
 
-def _run_explain_text(db_path: Path | str, sql: str, analyze: bool) -> str:
+# db path -> (mtime_ns, read-only connection); see _get_conn / close_connections
+_CONNS: Dict[str, tuple[int, "duckdb.DuckDBPyConnection"]] = {}
+_CONNS_LOCK = threading.Lock()
+
+def _get_conn(db: str, mtime_ns: int) -> duckdb.DuckDBPyConnection:
+    """
+    One read-only connection per DB file, reused by every EXPLAIN / EXPLAIN ANALYZE call
+    (catalog is loaded once). A rebuilt DB has a new mtime: its old connection is closed first.
+    Callers work on their own cursor, so concurrent threads never share a session.
+    """
+    with _CONNS_LOCK:
+        entry = _CONNS.get(db)
+        if entry is not None:
+            if entry[0] == mtime_ns:
+                return entry[1]
+            entry[1].close()
+        import duckdb  # deferred: runs whose outputs are all up to date never load DuckDB
+        con = duckdb.connect(db, read_only=True)
+        _CONNS[db] = (mtime_ns, con)
+        return con
+
+def close_connections() -> None:
+    """
+    Close every cached read-only connection. DuckDB refuses a second connection with another
+    configuration (e.g. read-write) to an open file, so call this before rebuilding or writing a DB.
+    """
+    with _CONNS_LOCK:
+        for _, con in _CONNS.values():
+            con.close()
+        _CONNS.clear()
+
+def _cursor(db: Path):
+    return _get_conn(str(db), db.stat().st_mtime_ns).cursor()
+
+@lru_cache(maxsize=64)
+def _resolved(db: Path) -> str:
+    return str(db.resolve())  # resolve() stats every path component; done once per DB path
+
+def _mode(analyze: bool) -> str:
+    return "analyze" if analyze else "explain"
+
+def _plan_cache_path(db: Path, sql: str, mode: str, params: Sequence | None = None) -> Path:
+    """
+    Cache file for (db file state, mode, statement[, params]). A rebuilt DB gets a new mtime → new key.
+    `mode` is "explain", "analyze" or "json" (json_serialize_plan document).
+    """
+    st = db.stat()
+    parts = [str(_PLAN_CACHE_VERSION), _resolved(db), str(st.st_mtime_ns), mode, sql.strip()]
+    if params is not None:
+        parts.append(repr(tuple(params)))  # unparameterized statements keep their existing keys
+    key = "\0".join(parts)
+    return PLAN_CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.txt"
+
+def _cache_get(cache_path: Path) -> str | None:
+    plan_text = _PLAN_MEMO.get(cache_path)
+    if plan_text is not None:
+        return plan_text  # repeat call in this process: no file read, no DuckDB
+    try:
+        plan_text = cache_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    _memo_put(cache_path, plan_text)
+    return plan_text
+
+def _memo_put(cache_path: Path, plan_text: str) -> None:
+    with _PLAN_MEMO_LOCK:
+        _PLAN_MEMO[cache_path] = plan_text
+        while len(_PLAN_MEMO) > _PLAN_MEMO_MAX:
+            del _PLAN_MEMO[next(iter(_PLAN_MEMO))]  # dicts keep insertion order: oldest first
+
+def _cache_put(cache_path: Path, plan_text: str) -> None:
+    PLAN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        f.write(plan_text)
+    os.replace(tmp, cache_path)  # atomic: readers never see a partial entry
+    _memo_put(cache_path, plan_text)
+
+@lru_cache(maxsize=4096)
+def _canonical_sql(sql: str) -> str | None:
+    """
+    sqlglot-canonical text of a statement (case, spacing and comments normalized),
+    or None when sqlglot is missing, cannot parse it, or it is already canonical.
+    """
+    try:
+        import sqlglot  # deferred: only parsed on a plan-cache miss
+        from sqlglot.errors import SqlglotError
+    except ImportError:
+        return None
+    text = sql.strip()
+    try:
+        canon = sqlglot.parse_one(text.rstrip(";"), read="duckdb").sql(dialect="duckdb", comments=False)
+    except SqlglotError:
+        return None
+    return canon if canon != text else None
+
+def _cache_lookup(
+    db: Path, sql: str, mode: str, params: Sequence | None, refresh: bool = False,
+) -> tuple[str | None, list[Path]]:
+    """
+    Cached plan text (or None) plus the cache paths to fill on a miss.
+    An EXPLAIN / JSON miss on the exact text retries under the canonical form, so reformatted
+    statements reuse the plan; ANALYZE text echoes the statement, so it is keyed verbatim.
+    With `refresh` every lookup is a miss, so the plan is recomputed and its entries overwritten.
+    """
+    path = _plan_cache_path(db, sql, mode, params)
+    verbatim = mode == "analyze"
+    if refresh:
+        canon = None if verbatim else _canonical_sql(sql)
+        return None, [path] if canon is None else [path, _plan_cache_path(db, canon, mode, params)]
+    plan_text = _cache_get(path)
+    if plan_text is not None or verbatim:
+        return plan_text, [path]
+    canon = _canonical_sql(sql)
+    if canon is None:
+        return None, [path]
+    alias = _plan_cache_path(db, canon, mode, params)
+    plan_text = _cache_get(alias)
+    if plan_text is not None:
+        _cache_put(path, plan_text)  # next lookup hits the exact key without parsing
+        return plan_text, [path]
+    return None, [path, alias]
+
+def _run_explain_text(
+    db_path: Path | str, sql: str, analyze: bool, params: Sequence | None = None, refresh: bool = False,
+) -> str:
     """
     Run EXPLAIN (or EXPLAIN ANALYZE) and return the ASCII plan as one string.
+    Served from the plan cache when the same statement was already explained on this DB,
+    unless `refresh` is set.
     """
     db = _ensure_db(db_path)
-    con = duckdb.connect(str(db), read_only=True)
-    try:
-        stmt = f"EXPLAIN {'ANALYZE ' if analyze else ''}{sql}"
-        rows = con.execute(stmt).fetchall()  # list[tuple[str, ...]]
-        plan_lines = [" ".join(str(c) for c in row if c is not None) for row in rows]
-        return "\n".join(plan_lines)
-    finally:
-        con.close()
+    plan_text, cache_paths = _cache_lookup(db, sql, _mode(analyze), params, refresh)
+    if plan_text is None:
+        cur = _cursor(db)
+        try:
+            plan_text = _explain_on(cur, sql, analyze, params)
+        finally:
+            cur.close()
+        for cache_path in cache_paths:
+            _cache_put(cache_path, plan_text)
+    return plan_text
 
-def get_explain_text(db_path: Path | str, sql: str) -> Dict[str, str]:
+def _run_explain_pair(
+    db_path: Path | str,
+    sql: str,
+    params: Sequence | None = None,
+    on_plan: Callable[[bool, str], None] | None = None,
+    refresh: bool = False,
+) -> tuple[str, str]:
+    """
+    (EXPLAIN text, EXPLAIN ANALYZE text) for one statement.
+    Cache misses run concurrently on sibling cursors of the cached connection,
+    so the optimizer-only EXPLAIN overlaps the ANALYZE execution.
+    `on_plan(analyze, text)` is called (in this thread) as soon as each plan is available,
+    e.g. to start writing the EXPLAIN files while ANALYZE is still executing.
+    `refresh` bypasses the plan cache (both plans are recomputed and re-cached).
+    """
+    db = _ensure_db(db_path)
+    texts, paths = map(list, zip(*(_cache_lookup(db, sql, _mode(analyze), params, refresh) for analyze in (False, True))))
+    missing = [k for k, t in enumerate(texts) if t is None]
+    if on_plan is not None:
+        for k, t in enumerate(texts):
+            if t is not None:
+                on_plan(bool(k), t)
+    if missing:
+        cursors = {k: _cursor(db) for k in missing}
+        try:
+            futures = {_PAIR_POOL.submit(_explain_on, cursors[k], sql, bool(k), params): k for k in missing}
+            for fut in as_completed(futures):
+                k = futures[fut]
+                texts[k] = fut.result()
+                for cache_path in paths[k]:
+                    _cache_put(cache_path, texts[k])
+                if on_plan is not None:
+                    on_plan(bool(k), texts[k])
+        finally:
+            for cur in cursors.values():
+                cur.close()
+    return texts[0], texts[1]
+
+def _explain_on(con, sql: str, analyze: bool, params: Sequence | None = None) -> str:
+    """
+    Run EXPLAIN (ANALYZE) on an open connection/cursor and return the clean ASCII plan.
+    `params` binds the statement's ? placeholders, so one SQL shape serves many values.
+    Only the explain_value column is read: the explain_key cell ("physical_plan" /
+    "analyzed_plan") is a header, so nothing has to be filtered or re-split.
+    """
+    stmt = f"EXPLAIN {'ANALYZE ' if analyze else ''}{sql}"
+    rows = con.execute(stmt, params).fetchall()  # list[tuple[str, str]] = (explain_key, explain_value)
+    return "\n".join(row[1] for row in rows if row[1] is not None).strip() + "\n"
+
+def get_explain_text(db_path: Path | str, sql: str, params: Sequence | None = None) -> Dict[str, str]:
     start = time.time()  
-    result = {"format": "text", "plan_text": _run_explain_text(db_path, sql, analyze=False)}
+    result = {"format": "text", "plan_text": _run_explain_text(db_path, sql, analyze=False, params=params)}
     elapsed = (time.time() - start) * 1000.0  
-    logger.info(f"EXPLAIN completed latency_ms={elapsed:.1f}")  
+    logger.debug("EXPLAIN completed latency_ms={:.1f}", elapsed)
     return result
 
-def get_explain_analyze_text(db_path: Path | str, sql: str) -> Dict[str, str]:
+def get_explain_analyze_text(db_path: Path | str, sql: str, params: Sequence | None = None) -> Dict[str, str]:
     start = time.time()  
-    result = {"format": "text", "plan_text": _run_explain_text(db_path, sql, analyze=True)}
+    result = {"format": "text", "plan_text": _run_explain_text(db_path, sql, analyze=True, params=params)}
     elapsed = (time.time() - start) * 1000.0  
-    logger.info(f"EXPLAIN ANALYZE completed latency_ms={elapsed:.1f}")  
+    logger.debug("EXPLAIN ANALYZE completed latency_ms={:.1f}", elapsed)
     return result
 
+def _serialize_plan(db_path: Path | str, sql: str) -> str:
+    """
+    Raw json_serialize_plan document ({"error":false,"plans":[...]}) for one statement,
+    served from the plan cache like the text plans.
+    Only a failed serialization is parsed, to raise its message as duckdb.Error (never cached).
+    """
+    db = _ensure_db(db_path)
+    raw, cache_paths = _cache_lookup(db, sql, "json", None)
+    if raw is not None:
+        return raw
+    cur = _cursor(db)
+    try:
+        raw = cur.execute("SELECT json_serialize_plan(?, optimize := true)", [sql.strip().rstrip(";")]).fetchone()[0]
+    finally:
+        cur.close()
+    if not raw.startswith('{"error":false'):
+        parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        if parsed.get("error"):
+            import duckdb
+            raise duckdb.Error(parsed.get("error_message", "json_serialize_plan failed"))
+    for cache_path in cache_paths:
+        _cache_put(cache_path, raw)
+    return raw
 
-def save_text_plan(plan: Dict[str, str], out_json: Path | str, out_txt: Path | str | None = None) -> Path:
+def get_explain_pair(
+    db_path: Path | str, sql: str, params: Sequence | None = None, refresh: bool = False,
+) -> tuple[str, str]:
+    """
+    (EXPLAIN text, EXPLAIN ANALYZE text) for one statement, without writing any file.
+    `refresh` re-runs both instead of serving them from the plan cache.
+    """
+    start = time.time()
+    texts = _run_explain_pair(db_path, sql, params, refresh=refresh)
+    logger.debug("EXPLAIN + ANALYZE completed latency_ms={:.1f}", (time.time() - start) * 1000.0)
+    return texts
+
+def get_explain_json(db_path: Path | str, sql: str) -> Dict[str, object]:
+    """
+    Optimized logical plan as a JSON tree, serialized by DuckDB itself (json_serialize_plan),
+    so no text plan is rendered and re-parsed in Python.
+    """
+    start = time.time()
+    raw = _serialize_plan(db_path, sql)
+    parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    logger.debug("EXPLAIN JSON completed latency_ms={:.1f}", (time.time() - start) * 1000.0)
+    return {"format": "json", "plan": parsed["plans"]}
+
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    if _same_content(path, data):
+        os.utime(path)  # unchanged plan: no rewrite, just mark the output fresh
+        return
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _same_content(path: Path, data: bytes) -> bool:
+    # size check first, so a changed plan usually costs one stat and no read
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except FileNotFoundError:
+        return False
+
+
+def _dump_plan(plan: Dict[str, str]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(plan, option=orjson.OPT_INDENT_2)
+    return json.dumps(plan, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def plan_dirs(dataset: str) -> tuple[Path, Path]:
+    """
+    Create (once per dataset) and return the JSON and TXT output dirs for <dataset>.
+    """
+    json_dir = RESULTS_JSON_ROOT / dataset
+    txt_dir = RESULTS_TXT_ROOT / dataset
+    json_dir.mkdir(parents=True, exist_ok=True)
+    txt_dir.mkdir(parents=True, exist_ok=True)
+    return json_dir, txt_dir
+
+
+def save_text_plan(
+    plan: Dict[str, str],
+    out_json: Path | str,
+    out_txt: Path | str | None = None,
+    json_dir: Path | None = None,
+    txt_dir: Path | None = None,
+) -> Path:
     """
     Write the plan dict to JSON and TXT.
     - JSON → results/explain_result_json/<dataset>/
     - TXT  → results/explain_result/<dataset>/
+    Batch callers pass json_dir/txt_dir from plan_dirs() so paths are built and created once.
+    """
+    writes, paths = _submit_plan_writes(plan, out_json, out_txt, json_dir, txt_dir)
+    _wait_writes(writes, paths)
+    return paths[0]
+
+
+def _submit_plan_writes(
+    plan: Dict[str, str],
+    out_json: Path | str,
+    out_txt: Path | str | None,
+    json_dir: Path | None,
+    txt_dir: Path | None,
+) -> tuple[list, list[Path]]:
+    """
+    Queue the JSON (and TXT) writes of one plan on _IO_POOL without waiting.
+    Returns (futures, written paths) with the JSON path first.
     """
     out_json = Path(out_json)
-    out_txt = Path(out_txt) if out_txt else None
-
-    # normalize + clean headers
-    raw = plan.get("plan_text", "")
-    norm = raw.replace("\r\n", "\n").replace("\r", "\n").lstrip()
-    clean_lines = []
-    for line in norm.splitlines():
-        ls = line.strip().lower()
-        if ls.startswith("analyzed_plan"):
-            continue
-        if ls.startswith("physical_plan"):
-            continue
-        if ls.startswith("explain analyze") or ls.startswith("explain "):
-            continue
-        clean_lines.append(line)
-    clean_text = "\n".join(clean_lines).strip() + "\n"
-
-    # derive dataset name from the original out_json path (without creating it)
-    dataset = out_json.parent.name  # e.g. 'flight-2'
+    clean_text = plan.get("plan_text", "")  # already cleaned by _explain_on
+
+    if json_dir is None or (out_txt and txt_dir is None):
+        # derive dataset name from the original out_json path (without creating it)
+        dataset = out_json.parent.name  # e.g. 'flight-2'
+        json_dir, txt_dir = plan_dirs(dataset)
 
     # JSON → results/explain_result_json/<dataset>/
-    json_dir = Path("results") / "explain_result_json" / dataset
-    json_dir.mkdir(parents=True, exist_ok=True)
     json_path = json_dir / out_json.name
-    json_path.write_text(json.dumps(plan, indent=2), encoding="utf-8")
+    writes = [_IO_POOL.submit(_write_bytes, json_path, _dump_plan(plan))]
 
     # TXT → results/explain_result/<dataset>/
     if out_txt:
-        txt_dir = Path("results") / "explain_result" / dataset
-        txt_dir.mkdir(parents=True, exist_ok=True)
-        txt_path = txt_dir / out_txt.name
-        with open(txt_path, "w", encoding="utf-8", newline="\n") as f:
-            f.write(clean_text)
-        logger.info(f"Saved TXT plan → {txt_path}")  
-        txt_path = None
-
-    logger.info(f"Saved JSON plan → {json_path}")  
-    return json_path
+        txt_path = txt_dir / Path(out_txt).name
+        writes.append(_IO_POOL.submit(_write_bytes, txt_path, clean_text.encode("utf-8")))
+        return writes, [json_path, txt_path]
+    return writes, [json_path]
+
+
+def _wait_writes(writes: list, paths: list[Path]) -> None:
+    for fut in writes:
+        fut.result()  # re-raises write errors in the caller
+    for path in paths:
+        logger.debug("Saved plan → {}", path)
 
 
 
 # -------- Compatibility aliases (tests/teammates may import these) --------
 
-def get_explain(db_path: Path | str, sql: str):
-    return get_explain_text(db_path, sql)
+def get_explain(db_path: Path | str, sql: str, params: Sequence | None = None):
+    return get_explain_text(db_path, sql, params)
 
-def get_explain_analyze(db_path: Path | str, sql: str):
-    return get_explain_analyze_text(db_path, sql)
+def get_explain_analyze(db_path: Path | str, sql: str, params: Sequence | None = None):
+    return get_explain_analyze_text(db_path, sql, params)
 
-def save_explain(db_path: Path | str, sql: str, out_path: Path | str):
-    plan = get_explain_text(db_path, sql)
+def save_explain(db_path: Path | str, sql: str, out_path: Path | str, params: Sequence | None = None):
+    plan = get_explain_text(db_path, sql, params)
     return save_text_plan(plan, out_path)
 
-def save_analyze(db_path: Path | str, sql: str, out_path: Path | str):
-    plan = get_explain_analyze_text(db_path, sql)
+def save_analyze(db_path: Path | str, sql: str, out_path: Path | str, params: Sequence | None = None):
+    plan = get_explain_analyze_text(db_path, sql, params)
     return save_text_plan(plan, out_path)
 
-def save_explain_pair(db_path: Path | str, sql: str, out_base: Path | str):
+def save_explain_json(db_path: Path | str, sql: str, out_path: Path | str, json_dir: Path | None = None) -> Path:
+    """
+    Write the json_serialize_plan document to results/explain_result_json/<dataset>/<name>.
+    DuckDB's JSON text goes to disk as-is: no json.loads / dumps round trip.
+    """
+    out_path = Path(out_path)
+    if json_dir is None:
+        json_dir, _ = plan_dirs(out_path.parent.name)
+    json_path = json_dir / out_path.name
+    _write_bytes(json_path, _serialize_plan(db_path, sql).encode("utf-8"))
+    logger.debug("Saved plan → {}", json_path)
+    return json_path
+
+def save_explain_pair(db_path: Path | str, sql: str, out_base: Path | str, params: Sequence | None = None):
     """
     Write TWO JSON files:
       <out_base>__explain.json
       <out_base>__analyze.json
+    `params` binds the statement's ? placeholders.
     Returns (path_explain_json, path_analyze_json).
     """
     base = Path(out_base)
     p_explain = base.with_name(base.name + "__explain.json")
     p_analyze = base.with_name(base.name + "__analyze.json")
-    save_explain(db_path, sql, p_explain)
-    save_analyze(db_path, sql, p_analyze)
+    writes, written = [], []
+
+    def _write_mode(analyze: bool, text: str) -> None:
+        w, paths = _submit_plan_writes({"format": "text", "plan_text": text},
+                                       p_analyze if analyze else p_explain, None, None, None)
+        writes.extend(w)
+        written.extend(paths)
+
+    # one pass for both modes; each file is queued as soon as its plan is ready
+    _run_explain_pair(db_path, sql, params, on_plan=_write_mode)
+    _wait_writes(writes, written)
     return p_explain, p_analyze
 
-def save_both(db_path: Path | str, sql: str, out_base: Path | str):
+def save_both(
+    db_path: Path | str,
+    sql: str,
+    out_base: Path | str,
+    json_dir: Path | None = None,
+    txt_dir: Path | None = None,
+    refresh: bool = False,
+):
     """
     Write BOTH formats for both modes:
       <out_base>__explain.json / .txt
       <out_base>__analyze.json / .txt
+    `refresh` re-runs EXPLAIN / EXPLAIN ANALYZE instead of using the plan cache (fresh timings).
     Returns (j_explain, t_explain, j_analyze, t_analyze).
     """
     base = Path(out_base)
-
-    # EXPLAIN (plan only)
-    plan = get_explain(db_path, sql)
+    # EXPLAIN (plan only) and EXPLAIN ANALYZE (plan + timings)
     json_explain = base.with_name(base.name + "__explain.json")
     txt_explain  = base.with_name(base.name + "__explain.txt")
-    save_text_plan(plan, json_explain, txt_explain)
-
-    # EXPLAIN ANALYZE (plan + timings)
-    plan_an = get_explain_analyze(db_path, sql)
     json_analyze = base.with_name(base.name + "__analyze.json")
     txt_analyze  = base.with_name(base.name + "__analyze.txt")
-    save_text_plan(plan_an, json_analyze, txt_analyze)
+    writes, written = [], []
+
+    def _write_mode(analyze: bool, text: str) -> None:
+        out_json, out_txt = (json_analyze, txt_analyze) if analyze else (json_explain, txt_explain)
+        w, paths = _submit_plan_writes({"format": "text", "plan_text": text}, out_json, out_txt, json_dir, txt_dir)
+        writes.extend(w)
+        written.extend(paths)
 
+    # the EXPLAIN files are being written while ANALYZE still executes
+    start = time.time()
+    _run_explain_pair(db_path, sql, on_plan=_write_mode, refresh=refresh)
+    logger.debug("EXPLAIN + ANALYZE completed latency_ms={:.1f}", (time.time() - start) * 1000.0)
+
+    _wait_writes(writes, written)  # all four files in flight together, one wait
     return json_explain, txt_explain, json_analyze, txt_analyze
+
+
+def store_plans(rows: Sequence[tuple[str, str, str, str, str]], store_path: Path | str = PLAN_STORE_PATH) -> int:
+    """
+    Upsert (dataset, query, variant, sql, plan_text) rows into the `plans` table of one DuckDB file,
+    in a single transaction: one file handle for a whole dataset instead of four files per statement.
+    Plans can then be queried directly, e.g. SELECT query FROM plans WHERE plan_text LIKE '%HASH_JOIN%'.
+    Returns the number of rows written.
+    """
+    import duckdb
+    store_path = Path(store_path)
+    store_path.parent.mkdir(parents=True, exist_ok=True)
+    con = duckdb.connect(str(store_path))
+    try:
+        con.execute(
+            "CREATE TABLE IF NOT EXISTS plans ("
+            "dataset VARCHAR, query VARCHAR, variant VARCHAR, sql VARCHAR, plan_text VARCHAR, "
+            "created TIMESTAMP, PRIMARY KEY (dataset, query, variant))"
+        )
+        con.execute("BEGIN")
+        con.executemany("INSERT OR REPLACE INTO plans VALUES (?, ?, ?, ?, ?, now())", rows)
+        con.execute("COMMIT")
+    finally:
+        con.close()
+    logger.debug("Stored {} plan(s) → {}", len(rows), store_path)
+    return len(rows)
@@ -5,20 +5,19 @@ in queries_*.sql
 Usage:
   (.venv) python -m src.db.run_explain_plans world
   (.venv) python -m src.db.run_explain_plans all
+  (.venv) python -m src.db.run_explain_plans all --force   # re-run every statement (no plan cache) and rewrite its outputs
+  (.venv) python -m src.db.run_explain_plans all --store   # one DuckDB table instead of per-query files
 """
 
 from pathlib import Path
+from typing import Iterator
 import sys
 import time
 
-HERE = Path(__file__).resolve()
-ROOT = HERE.parents[2]  # repo-root
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
-
-from . import duckdb_explain as dx
-from .duckdb_explain import save_both
+from .duckdb_explain import save_both, plan_dirs, get_explain_pair, store_plans, close_connections, PLAN_STORE_PATH
+from .sql_splitter import iter_sql_statements
 
+from src.utils import ROOT  # repo-root, resolved once in src.utils.constants
 from src.utils.logging_config import logger, log_query_event
 
 
@@ -31,16 +30,42 @@ def find_datasets() -> list[Path]:
     return sorted([p for p in DATA_ROOT.iterdir() if p.is_dir()]) # dataset dirs
 
 
-def load_statements(sql_file: Path) -> list[str]:
+def load_statements(sql_file: Path) -> Iterator[str]:
     """
+    Lazily yields the statements of the file.
     Ensures each statement ends with a semicolon for clearer logs 
     """
     text = sql_file.read_text(encoding="utf-8") 
-    stmts = [s.strip() for s in text.split(";") if s.strip()] 
-    return [s if s.endswith(";") else s + ";" for s in stmts]
+    for s in iter_sql_statements(text):
+        yield s + ";"
+
+
+def _outputs_fresh(paths: tuple[Path, ...], newer_than: float) -> bool:
+    """
+    True if every output exists and was written after `newer_than` (mtime).
+    """
+    try:
+        return min(p.stat().st_mtime for p in paths) > newer_than
+    except FileNotFoundError:
+        return False
+
+
+def process_dataset(dataset_dir: Path, force: bool = False, store: bool = False) -> int:
+    """
+    Write the plans of every statement of the dataset; returns the number written.
+    Statements whose four outputs are newer than both the DB and the .sql file
+    are skipped unless `force` is set; `force` also bypasses the plan cache, so every
+    statement is explained and executed again (fresh ANALYZE timings).
+    With `store`, the plans are upserted into the PLAN_STORE_PATH table in one go
+    instead of being written as files (repeat plans come from the plan cache).
+    """
+    try:
+        return _process_dataset(dataset_dir, force, store)
+    finally:
+        close_connections()  # release the read-only handles: the DB may be rebuilt / opened read-write next
 
 
-def process_dataset(dataset_dir: Path) -> int:
+def _process_dataset(dataset_dir: Path, force: bool, store: bool) -> int:
     dataset = dataset_dir.name
     db_path = dataset_dir / f"{dataset.lower()}.duckdb"
     if not db_path.exists():
@@ -55,33 +80,58 @@ def process_dataset(dataset_dir: Path) -> int:
         return 0
 
     dataset_start = time.time()  
+    # built and created once per dataset; --store writes no plan files, so no dirs either
+    json_dir, txt_dir = (None, None) if store else plan_dirs(dataset)
     total = 0
+    skipped = 0
+    stored = []  # (dataset, query, variant, sql, plan_text) rows for store_plans
+    db_mtime = db_path.stat().st_mtime
     for sql_path in sql_files:
-        stmts = load_statements(sql_path)
         stem = sql_path.stem  # e.g., queries_world
-        logger.info(f"{sql_path.name} → {len(stmts)} statement(s)")
-        for i, sql in enumerate(stmts, 1):
+        inputs_mtime = max(db_mtime, sql_path.stat().st_mtime)
+        i = 0
+        for i, sql in enumerate(load_statements(sql_path), 1):
             base = out_dir / f"{stem}__q{i}"
+            if not force and not store:
+                name = base.name
+                outputs = (
+                    json_dir / f"{name}__explain.json", txt_dir / f"{name}__explain.txt",
+                    json_dir / f"{name}__analyze.json", txt_dir / f"{name}__analyze.txt",
+                )
+                if _outputs_fresh(outputs, inputs_mtime):
+                    skipped += 1
+                    continue
             try:
+                if store:
+                    explain_text, analyze_text = get_explain_pair(db_path, sql, refresh=force)
+                    stored += [(dataset, base.name, "explain", sql, explain_text),
+                               (dataset, base.name, "analyze", sql, analyze_text)]
+                    total += 1
+                    continue
                 # Writes 4 files:
                 #   <base>__explain.json / .txt
                 #   <base>__analyze.json / .txt
-                j1, t1, j2, t2 = save_both(db_path, sql, base)
-                logger.info(f"✓ {base.name}  (EXPLAIN + ANALYZE)")
+                j1, t1, j2, t2 = save_both(db_path, sql, base, json_dir, txt_dir, refresh=force)
+                logger.debug("✓ {}  (EXPLAIN + ANALYZE)", base.name)
                 total += 1
             except Exception as e:
                 logger.error(f"✗ {base.name} -> {e}")
+        logger.info(f"{sql_path.name} → {i} statement(s)")
+    if stored:
+        store_plans(stored)
     elapsed_ms  = (time.time() - dataset_start) * 1000.0  
-    log_query_event("dataset_completed", dataset=dataset, statements=total, latency_ms=f"{elapsed_ms:.1f}") 
+    log_query_event("dataset_completed", dataset=dataset, statements=total, skipped=skipped, latency_ms=f"{elapsed_ms:.1f}") 
     return total
 
 
 
 def main():
 
-    args = [a.strip().upper() for a in sys.argv[1:]]
+    force = "--force" in sys.argv[1:]
+    store = "--store" in sys.argv[1:]
+    args = [a.strip().upper() for a in sys.argv[1:] if a not in ("--force", "--store")]
 
-    if not args or "all" in args:
+    if not args or "ALL" in args:
         datasets = find_datasets()
         if not datasets:
             logger.error(f"No datasets found in {DATA_ROOT}")
@@ -102,11 +152,11 @@ def main():
     grand_total = 0
     for ds in datasets:
         logger.info(f"=== DATASET: {ds.name} ===")
-        grand_total += process_dataset(ds)
+        grand_total += process_dataset(ds, force=force, store=store)
 
     total_ms = (time.time() - run_start) * 1000.0  
     logger.info(f"Done. Wrote plans for {grand_total} statement(s). total_latency_ms={total_ms:.1f}")
-    logger.info(f"Results → {RESULTS_ROOT}")
+    logger.info(f"Results → {PLAN_STORE_PATH.resolve() if store else RESULTS_ROOT}")
 
 
 if __name__ == "__main__":
@@ -1,8 +1,10 @@
-import os, json, glob, sys, time
+import os, json, glob, sys, time, threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from .db_connection import connect_to_duckdb
+from .sql_splitter import iter_sql_statements
 from src.utils import DATA_DIR, SUBMISSIONS_PATH
-from src.utils.logging_config import logger
+from src.utils.logging_config import logger, log_query_event
 
 
 os.makedirs(SUBMISSIONS_PATH, exist_ok=True)
@@ -16,62 +18,96 @@ def load_queries_from_folder(folder_path: str):
     queries = []
 
     for file_path in sorted(glob.glob(os.path.join(folder_path, "queries_*.sql"))):
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-            # Split multiple queries in a single file by ";"
-            for q in content.split(";"):
-                q = q.strip()
-                if q:  # Skip empty strings
-                    #print(f"Query: {q}")
-                    queries.append((os.path.basename(file_path), q))
+        filename = os.path.basename(file_path)
+        # Read in one call; the splitter already strips each statement
+        content = Path(file_path).read_text(encoding="utf-8")
+        # Split multiple queries in a single file by ";" (outside strings/comments)
+        queries.extend((filename, q) for q in iter_sql_statements(content))
 
     logger.info(f"Found {len(queries)} queries in {folder_path} (pattern: queries_*.sql)")
     return queries
 
 
 
-def execute_queries_and_save_json(con, queries, output_dir):
+def _ints_to_float(row, idx):
+    row = list(row)
+    for k in idx:
+        if isinstance(row[k], int):
+            row[k] = float(row[k])
+    return row
+
+
+def _execute_query_and_save_json(cur, i, filename, query, output_dir):
     """
-    Execute each query on the DuckDB connection and save results as JSON files.
+    Execute a single query on the given cursor and save its result as query<i>.json.
+    Returns True on success; per-query details are only logged at DEBUG level.
     """
-    output_dir = str(output_dir)
-    os.makedirs(output_dir, exist_ok=True)
-    logger.info(f"Saving query results to → {output_dir}")
+    try:
+        t0 = time.time()
+        result = cur.execute(query)
+        rows = result.fetchall()
+        columns = [desc[0] for desc in result.description]
 
-    for i, (filename, query) in enumerate(queries, start=1):
-        #print(f"\n  Executing query {i} from file {filename}")
-        try:
-            t0 = time.time()
-            result = con.execute(query)
-            rows = result.fetchall()
-            columns = [desc[0] for desc in result.description]
+        # sum(...) / avg(...) integers are written as floats; find those columns once per query
+        agg_idx = [k for k, c in enumerate(columns) if "sum(" in c or "avg(" in c]
+        if agg_idx:
+            rows = [_ints_to_float(row, agg_idx) for row in rows]
 
-            # Convert result to list of dictionaries
-            data = []
-            for row in rows:
-                row_dict = dict(zip(columns, row))
+        # Convert result to list of dictionaries
+        data = [dict(zip(columns, row)) for row in rows]
 
-                for key, value in row_dict.items():
-                    if ("sum(" in key or "avg(" in key) and isinstance(value, int):
-                        row_dict[key] = float(value)
+        # Create JSON filename based on SQL file name
+        json_name = f"query{i}.json"
+        output_path = os.path.join(output_dir, json_name)
 
-                data.append(row_dict)
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
 
-            # Create JSON filename based on SQL file name
-            json_name = f"query{i}.json"
-            output_path = os.path.join(output_dir, json_name)
+        elapsed = (time.time() - t0) * 1000.0
+        logger.debug(
+            "[{}] query{} → {} | rows={} | latency_ms={:.1f}", filename, i, json_name, len(data), elapsed
+        )
+        return True
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    except Exception as e:
+        logger.error(f"Error executing query from {filename}: {e}")
+        return False
 
-            elapsed = (time.time() - t0) * 1000.0
-            logger.info(
-                f"[{filename}] query{i} → {json_name} | rows={len(data)} | latency_ms={elapsed:.1f}"
-            )
 
-        except Exception as e:
-            logger.error(f"Error executing query from {filename}: {e}")
-        
+def execute_queries_and_save_json(con, queries, output_dir, max_workers: int = 4):
+    """
+    Execute each query on the DuckDB connection and save results as JSON files.
+    Queries are spread over `max_workers` threads; every thread runs on its own
+    cursor (a cheap cloned session on the same database) so no statement state
+    is shared across threads.
+    """
+    output_dir = str(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    logger.info(f"Saving query results to → {output_dir}")
+
+    local = threading.local()
+    cursors = []
+    t0 = time.time()
+
+    def run_one(item):
+        i, (filename, query) = item
+        cur = getattr(local, "cur", None)
+        if cur is None:
+            cur = local.cur = con.cursor()
+            cursors.append(cur)
+        return _execute_query_and_save_json(cur, i, filename, query, output_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            ok = sum(pool.map(run_one, enumerate(queries, start=1)))
+    finally:
+        for cur in cursors:
+            cur.close()
+
+    elapsed_ms = (time.time() - t0) * 1000.0
+    log_query_event("queries_completed", output_dir=output_dir, queries=len(queries),
+                    ok=ok, failed=len(queries) - ok, latency_ms=f"{elapsed_ms:.1f}")
+
     print("\n")
 
 def run_queries_to_json(dataset_name: str) -> None:
@@ -79,13 +115,16 @@ def run_queries_to_json(dataset_name: str) -> None:
     data_dir.mkdir(parents=True, exist_ok=True)
     
     con = connect_to_duckdb(dataset_name)
-    qrs = load_queries_from_folder(data_dir)
-
-    if qrs:
-        complete_path = SUBMISSIONS_PATH / f"{dataset_name}"
-        execute_queries_and_save_json(con, qrs, complete_path)
-    else:
-        logger.warning(f"No queries found for dataset '{dataset_name}' in {data_dir}")
+    try:
+        qrs = load_queries_from_folder(data_dir)
+
+        if qrs:
+            complete_path = SUBMISSIONS_PATH / f"{dataset_name}"
+            execute_queries_and_save_json(con, qrs, complete_path)
+        else:
+            logger.warning(f"No queries found for dataset '{dataset_name}' in {data_dir}")
+    finally:
+        con.close()
 
 
 
@@ -0,0 +1,43 @@
+"""
+Split a SQL script into single statements.
+
+Unlike text.split(";"), semicolons inside 'string literals', "quoted identifiers",
+-- line comments and /* block comments */ do not terminate a statement.
+Statements are yielded lazily, stripped and without the trailing semicolon;
+chunks made only of whitespace/comments are skipped.
+"""
+
+import re
+from typing import Iterator
+
+# Everything that can hide a ";" plus the ";" itself. A doubled quote is an escaped quote.
+_TOKEN_RE = re.compile(
+    r"""'(?:[^']|'')*(?:'|\Z)"""
+    r'''|"(?:[^"]|"")*(?:"|\Z)'''
+    r"|--[^\n]*"
+    r"|/\*.*?(?:\*/|\Z)"
+    r"|;",
+    re.S,
+)
+
+
+def iter_sql_statements(text: str) -> Iterator[str]:
+    start = 0         # start of the current statement
+    pos = 0           # end of the last token
+    has_code = False  # current statement contains something besides comments
+
+    for m in _TOKEN_RE.finditer(text):
+        if not has_code and m.start() > pos and not text[pos:m.start()].isspace():
+            has_code = True
+        tok = m.group()
+        if tok == ";":
+            if has_code:
+                yield text[start:m.start()].strip()
+            start = m.end()
+            has_code = False
+        elif tok[0] in "'\"":
+            has_code = True
+        pos = m.end()
+
+    if has_code or text[pos:].strip():
+        yield text[start:].strip()
@@ -2,7 +2,6 @@ import logging
 import os
 import json
 
-from dotenv import load_dotenv
 from .sql_to_nl import sql_to_nl
 from pathlib import Path
 from ..utils.constants import *
@@ -10,10 +9,6 @@ from .watsonx_ai_connection import query_watsonx
 from ..db.run_queries_to_json import load_queries_from_folder
 from ..utils.build_prompt_context import build_prompt_context
 
-#CONFIGURE THE API KEY
-load_dotenv()
-api_key = os.getenv("WATSONX_API_KEY", "").strip()
-
 """
     The goal of this script is to query the LLM model with interrogations in Natural Language
     receive the answer from the LLM model and stores it.
@@ -36,7 +31,7 @@ def llm_interaction():
 
     for dataset_name in os.listdir(DATA_DIR):
         print(f"Checking folder: {dataset_name}")
-        if dataset_name in DATASETS:
+        if dataset_name in DATASETS_SET:
             dataset_path = os.path.join(DATA_DIR, dataset_name)
             if not os.path.isdir(dataset_path):
                 continue
@@ -47,17 +42,23 @@ def llm_interaction():
             for i, (filename, query) in enumerate(queries, start=1):
                 print(f"{query}")
 
-            nl_prompts = []
-            for i, (filename, sql_query) in enumerate(queries):
-                nl_prompt = sql_to_nl(sql_query)
-                logging.info(f"🧠 NL prompt generated: {nl_prompt}")
+            if not queries:
+                continue
 
-                context_prompt = build_prompt_context(dataset_name)
-                full_prompt = f"{context_prompt}\nQuestion: {nl_prompts}"
+            # One batched call converts every query of the dataset to NL ...
+            sql_queries = [sql_query for _, sql_query in queries]
+            nl_prompts = sql_to_nl(sql_queries)
 
-                # Create a folder for the dataset within the prompt folder
-                dataset_prompt_folder = os.path.join(PROMPTS, dataset_name)
-                os.makedirs(dataset_prompt_folder, exist_ok=True)
+            # Create a folder for the dataset within the prompt folder
+            dataset_prompt_folder = os.path.join(PROMPTS, dataset_name)
+            os.makedirs(dataset_prompt_folder, exist_ok=True)
+
+            # Schema context goes in the system message (same prefix for the whole dataset)
+            context_prompt = build_prompt_context(dataset_name)
+            questions = []
+            for i, nl_prompt in enumerate(nl_prompts):
+                logging.info(f"🧠 NL prompt generated: {nl_prompt}")
+                questions.append(f"Question: {nl_prompt}")
 
                 # Save the NL prompts in JSON
                 json_filename = f"nl_prompt_query{i}_{dataset_name}.json"
@@ -67,9 +68,9 @@ def llm_interaction():
 
                 logging.info(f"Prompts NL saved in: {json_path}")
 
-                # Query the model with NL prompts generated before
-
-                response = query_watsonx(full_prompt)
+            # ... and a second one queries the model with the NL prompts generated before
+            responses = query_watsonx(questions, system_prompt=context_prompt)
+            for sql_query, response in zip(sql_queries, responses):
                 logging.info(f"Answer for the query {sql_query} in dataset {dataset_name}:\n{response}\n{'-'*50}")
 
 if __name__ == "__main__":
@@ -29,14 +29,14 @@ def query_llm(query: str, model: str = "gemini-2.5-flash", temperature: float =
     """
 
     try:
-        logger.info(f"Initializing Google GenAI model={model} temperature={temperature}")
+        logger.info("Initializing Google GenAI model={} temperature={}", model, temperature)
         llm = ChatGoogleGenerativeAI(model=model, temperature=temperature, max_tokens=2000)
 
         # 1) Direct invoke (quick probe / warmup)
         direct_prompt = f"Answer the question in a generic way: {query}"
         t0 = time.time()
         _ = llm.invoke(direct_prompt)
-        logger.info(f"gemini_invoke latency_ms={(time.time() - t0) * 1000.0:.1f}")
+        logger.info("gemini_invoke latency_ms={:.1f}", (time.time() - t0) * 1000.0)
 
         # 2) Chain with a template (example in Italian to match your slides)
         template = "Rispondi in italiano alla seguente domanda in modo chiaro e conciso: {query}"
@@ -46,7 +46,7 @@ def query_llm(query: str, model: str = "gemini-2.5-flash", temperature: float =
         t1 = time.time()
         response = chain.invoke({"query": query})
         latency_ms = (time.time() - t1) * 1000.0
-        logger.info(f"gemini_chain latency_ms={latency_ms:.1f} response_len={len(str(response))}")
+        logger.info("gemini_chain latency_ms={:.1f} response_len={}", latency_ms, len(str(response)))
         return response
 
     except LangChainException as e:
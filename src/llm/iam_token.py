@@ -0,0 +1,98 @@
+"""
+IBM Cloud IAM bearer-token cache for watsonx.ai.
+
+Exchanging the API key for a token (POST /identity/token) costs a round-trip and the
+token stays valid for ~1h, so it is kept in memory and on disk and reused across
+calls and runs until 60s before it expires.
+
+Disk location: $CACHE_DIR/watsonx_token.json, else ~/.cache/galileo/watsonx_token.json
+(owner-only permissions). Entries are bound to a hash of the API key, never the key itself.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+
+from src.utils.logging_config import logger
+from .retry import call_with_retry
+
+DEFAULT_IAM_URL = "https://iam.cloud.ibm.com/identity/token"  # override with WATSONX_IAM_URL
+REFRESH_MARGIN_SEC = 60
+
+_lock = threading.Lock()
+_memo: dict[str, tuple[str, float]] = {}  # key hash -> (token, expires_at)
+
+
+def _cache_file() -> Path:
+    base = os.getenv("CACHE_DIR")
+    root = Path(base) if base else Path.home() / ".cache" / "galileo"
+    return root / "watsonx_token.json"
+
+
+def _key_hash(api_key: str) -> str:
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _read_disk(key_hash: str) -> tuple[str, float] | None:
+    try:
+        with open(_cache_file(), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("key_hash") == key_hash:
+            return data["access_token"], float(data["expires_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_disk(key_hash: str, token: str, expires_at: float) -> None:
+    path = _cache_file()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"key_hash": key_hash, "access_token": token, "expires_at": expires_at}, f)
+        os.replace(tmp, path)
+        os.chmod(path, 0o600)
+    except OSError as e:
+        logger.warning(f"Unable to persist watsonx IAM token: {e}")
+
+
+def _fresh(entry: tuple[str, float] | None) -> bool:
+    return entry is not None and time.time() < entry[1] - REFRESH_MARGIN_SEC
+
+
+def _exchange(api_key: str) -> tuple[str, float]:
+    t0 = time.time()
+    resp = requests.post(
+        os.getenv("WATSONX_IAM_URL", DEFAULT_IAM_URL).strip(),
+        data={"grant_type": "urn:ibm:params:oauth:grant-type:apikey", "apikey": api_key},
+        headers={"Accept": "application/json"},
+        timeout=30,
+    )
+    resp.raise_for_status()
+    body = resp.json()
+    expires_at = float(body.get("expiration") or (t0 + float(body.get("expires_in", 3600))))
+    logger.info(f"watsonx IAM token refreshed latency_ms={(time.time() - t0) * 1000.0:.1f}")
+    return body["access_token"], expires_at
+
+
+def get_iam_token(api_key: str) -> str:
+    """
+    A valid bearer token for `api_key`: memory → disk → IAM exchange.
+    """
+    key_hash = _key_hash(api_key)
+    with _lock:
+        entry = _memo.get(key_hash)
+        if not _fresh(entry):
+            entry = _read_disk(key_hash)
+            if not _fresh(entry):
+                entry = call_with_retry(_exchange, api_key)
+                _write_disk(key_hash, *entry)
+            _memo[key_hash] = entry
+        return entry[0]
@@ -0,0 +1,99 @@
+"""
+Content-addressed disk cache for deterministic LLM responses.
+
+Key = sha256 of {"provider", "model", "prompt", "params"} (sorted JSON), so the same
+prompt sent with the same model and decoding parameters is answered from disk.
+Prompts are keyed on their layout-normalized form (see normalize_prompt), so
+reruns that only re-indent or re-wrap a prompt still hit.
+Only deterministic calls (greedy decoding / temperature 0) should be cached:
+sampled outputs would otherwise be frozen to their first draw.
+
+Layout: data/.llm_cache/<key[:2]>/<key>.json  → {"response": ...}
+Entries older than the TTL are ignored (and overwritten on the next call).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any
+
+from src.utils import LLM_CACHE_DIR
+from src.utils.logging_config import logger
+
+CACHE_VERSION = 3                  # bump when the cached response format changes
+DEFAULT_TTL_SEC = 7 * 24 * 3600    # one week
+
+
+def normalize_prompt(prompt: Any) -> Any:
+    """
+    Layout-only normalization: unify line endings, strip every line and drop blank lines.
+    Spacing inside a line is kept (it may sit inside an SQL string literal).
+    """
+    if isinstance(prompt, str):
+        return "\n".join(line for line in map(str.strip, prompt.splitlines()) if line)
+    if isinstance(prompt, (list, tuple)):
+        return [normalize_prompt(p) for p in prompt]
+    return prompt
+
+
+def cache_key(provider: str, model: str, prompt: Any, params: dict | None = None) -> str:
+    payload = {
+        "v": CACHE_VERSION,
+        "provider": provider,
+        "model": model,
+        "prompt": normalize_prompt(prompt),
+        "params": params or {},
+    }
+    blob = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def is_deterministic(params: dict | None, chat: bool = False) -> bool:
+    """
+    True when the call always returns the same text for the same prompt.
+    Generate params: greedy decoding (the watsonx default) or a temperature of 0.
+    Chat params have no decoding_method and sample by default: only temperature 0 counts.
+    """
+    params = params or {}
+    if not chat and params.get("decoding_method", "greedy") == "greedy":
+        return True
+    return params.get("temperature") == 0
+
+
+def _path(key: str):
+    return LLM_CACHE_DIR / key[:2] / f"{key}.json"
+
+
+def cache_get(key: str, ttl: float = DEFAULT_TTL_SEC) -> Any | None:
+    """
+    Cached response for `key`, or None on miss / expiry / unreadable entry.
+    """
+    path = _path(key)
+    try:
+        if time.time() - path.stat().st_mtime > ttl:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["response"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def cache_set(key: str, response: Any) -> None:
+    """
+    Store `response` (must be JSON-serializable). Failures are logged, never raised.
+    """
+    path = _path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"response": response}, f, ensure_ascii=False)
+        os.replace(tmp, path)  # atomic: concurrent readers never see a partial entry
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"LLM cache write failed for {key[:12]}: {e}")
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
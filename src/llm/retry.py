@@ -0,0 +1,108 @@
+"""
+Retry transient LLM API failures with capped exponential backoff + jitter.
+
+Only throttling / server-side errors (HTTP 429, 5xx) and connection / timeout
+errors are retried; anything else (bad request, auth, ...) is raised immediately.
+A Retry-After (or X-RateLimit-Reset) header on the failed response sets the next
+sleep instead of the computed backoff.
+Attempts and base delay come from config.yaml (execution.max_retries / backoff_sec).
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from src.utils.logging_config import logger
+
+try:
+    import httpx
+    _TRANSPORT_ERRORS: tuple[type[BaseException], ...] = (httpx.TransportError,)
+except ImportError:  # httpx ships with ibm-watsonx-ai
+    _TRANSPORT_ERRORS = ()
+
+try:
+    import requests
+    _TRANSPORT_ERRORS += (requests.ConnectionError, requests.Timeout)
+except ImportError:
+    pass
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+MAX_BACKOFF_SEC = 30.0
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=1)
+def _retry_settings() -> tuple[int, float]:
+    """
+    (max_retries, backoff_sec) from config.yaml, read once on first use.
+    """
+    try:
+        from config import get_settings
+        execution = get_settings().execution
+        return execution.max_retries, execution.backoff_sec
+    except Exception as e:
+        logger.warning(f"Retry settings unavailable ({e}); using max_retries=3 backoff_sec=1.5")
+        return 3, 1.5
+
+
+def _status_code(exc: BaseException) -> int | None:
+    response = getattr(exc, "response", None)
+    code = getattr(response, "status_code", None)
+    try:
+        return int(code) if code is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, (ConnectionError, TimeoutError) + _TRANSPORT_ERRORS):
+        return True
+    return _status_code(exc) in RETRYABLE_STATUS
+
+
+def _server_delay(exc: BaseException) -> float | None:
+    """
+    Seconds to wait as requested by the server (Retry-After / X-RateLimit-Reset), if any.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After") or headers.get("X-RateLimit-Reset")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+        if seconds > 1e9:  # epoch timestamp rather than a delay
+            seconds -= time.time()
+    except ValueError:
+        try:
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, seconds)
+
+
+def call_with_retry(fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Call fn(*args, **kwargs), retrying transient failures up to max_retries times.
+    Full jitter (uniform in [0, backoff]) keeps concurrent workers from retrying in lockstep.
+    """
+    max_retries, backoff_sec = _retry_settings()
+    attempt = 0
+    while True:
+        try:
+            return fn(*args, **kwargs)
+        except Exception as e:
+            if attempt >= max_retries or not is_retryable(e):
+                raise
+            delay = _server_delay(e)  # the server knows best when to come back
+            if delay is None:
+                delay = random.uniform(0.0, min(MAX_BACKOFF_SEC, backoff_sec * 2 ** attempt))
+            attempt += 1
+            logger.warning(
+                f"Transient error ({type(e).__name__}: {e}); retry {attempt}/{max_retries} in {delay:.2f}s"
+            )
+            time.sleep(delay)
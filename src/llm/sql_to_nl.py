@@ -1,6 +1,14 @@
 from .watsonx_ai_connection import query_watsonx
 
 
-def sql_to_nl(sql_query: str) -> str:
-    prompt = f"Convert this SQL query in a natural language prompt useful for the LLM:\n{sql_query}"
-    return query_watsonx(prompt)
\ No newline at end of file
+def _nl_request(sql_query: str) -> str:
+    return f"Convert this SQL query in a natural language prompt useful for the LLM:\n{sql_query}"
+
+
+def sql_to_nl(sql_query: str | list[str]):
+    """
+    Convert one SQL query (or a list of them, in a single batched call) into NL prompt(s).
+    """
+    if isinstance(sql_query, list):
+        return query_watsonx([_nl_request(q) for q in sql_query])
+    return query_watsonx(_nl_request(sql_query))
@@ -4,37 +4,81 @@ IBM watsonx.ai connection with structured logging.
 - Logs errors cleanly
 """
 
+import asyncio
 import os
 import time
 import traceback
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from dotenv import load_dotenv
 from ibm_watsonx_ai import Credentials
 from ibm_watsonx_ai.foundation_models import ModelInference
-from openai import max_retries
 
 from src.utils.logging_config import logger, log_query_event
+from .llm_cache import cache_key, cache_get, cache_set, is_deterministic
+from .retry import call_with_retry
+from .iam_token import get_iam_token
 
+# CONFIGURE THE API KEY (read once at import, not per prompt)
+load_dotenv()
+WATSONX_API_KEY = os.getenv("WATSONX_API_KEY", "").strip()
+WATSONX_URL = os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com").strip()
+WATSONX_PROJECT_ID = os.getenv("WATSONX_PROJECT_ID", "").strip()
+WATSONX_BATCH_CONCURRENCY = 10  # parallel requests for a list of prompts (SDK maximum)
 
-def query_watsonx(prompt: str,
+
+@lru_cache(maxsize=16)
+def _get_watsonx_model(url: str, api_key: str, project: str, model_id: str,
+                       token: str | None = None) -> ModelInference:
+    """
+    One ModelInference per (url, key, project, model, token): connection setup happens once,
+    and a refreshed IAM token yields a new client.
+    """
+    logger.info(f"Initializing watsonx.ai model_id={model_id}")
+    if token:
+        creds = Credentials(url=url, token=token)  # cached bearer token, no key exchange
+    else:
+        creds = Credentials(url=url, api_key=api_key)
+    return ModelInference(model_id=model_id, credentials=creds, project_id=project)
+
+
+def _generated_text(response: dict) -> str:
+    # Read the answer field directly (chat() answers under "choices", generate() under "results")
+    if "choices" in response:
+        return response["choices"][0].get("message", {}).get("content") or ""
+    return response.get("results", [{}])[0].get("generated_text", "")
+
+
+def _chat_messages(system_prompt: str, user_prompt: str) -> list[dict]:
+    # Static system prefix first, dynamic question last: identical prefixes hit provider-side prompt caches
+    return [{"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}]
+
+
+def query_watsonx(prompt: str | list[str],
                    model_id: str = "ibm/granite-3-8b-instruct",
-                   project_id: str | None = None) -> str:
+                   project_id: str | None = None,
+                   system_prompt: str | None = None) -> str | list[str]:
     """
     Send a prompt to IBM watsonx.ai and return the generated text.
+    A list of prompts is sent as one batched generate() call (the SDK runs up to
+    WATSONX_BATCH_CONCURRENCY requests in parallel) and a list is returned, in prompt order.
+    With `system_prompt`, chat() is used instead: the system prompt (e.g. the dataset
+    schema context) is sent as a separate system message and each prompt as the user message.
     Requires:
       - WATSONX_URL (env)
       - WATSONX_API_KEY (env)
       - WATSONX_PROJECT_ID (env or provided)
     """
 
-    # CONFIGURE THE API KEY
-    load_dotenv()
-    api_key = os.getenv("WATSONX_API_KEY", "").strip()
+    api_key = WATSONX_API_KEY
+    batched = isinstance(prompt, list)
+    prompts = prompt if batched else [prompt]
 
     try:
 
-        url = os.getenv("WATSONX_URL", "https://us-south.ml.cloud.ibm.com").strip()
-        project = project_id or os.getenv("WATSONX_PROJECT_ID", "").strip()
+        url = WATSONX_URL
+        project = project_id or WATSONX_PROJECT_ID
 
         if not api_key:
             logger.error("WATSONX_API_KEY environment variable not set")
@@ -43,30 +87,74 @@ def query_watsonx(prompt: str,
             logger.error("WATSONX_PROJECT_ID missing (provide arg or env var)")
             raise SystemExit(1)
 
-        logger.info(f"Initializing watsonx.ai model_id={model_id}")
-        creds = Credentials(url=url, api_key=api_key)
-        model = ModelInference(model_id=model_id, credentials=creds, project_id=project)
-
-        t0 = time.time()
-        response = model.generate(prompt=prompt,  params={"max_new_tokens": 200})
-        latency_ms = (time.time() - t0) * 1000.0
-        logger.info(f"watsonx.generate latency_ms={latency_ms:.1f}")
-
-        # Supponiamo response sia JSON o un oggetto simile a dizionario
-        if isinstance(response, str):
-            response_json = json.loads(response)  # se è stringa JSON
+        if system_prompt is None:
+            provider, params = "watsonx", {"max_new_tokens": 200}
         else:
-            response_json = response  # se è già dict-like
+            provider, params = "watsonx-chat", {"max_tokens": 200, "temperature": 0}
 
-        # Estrai la parte di interesse
-        generated_text = response_json.get('results', [{}])[0].get('generated_text', '')
-
-        logger.info(f"watsonx_response_len chars={len(generated_text)}")
-        return response
+        # Deterministic (greedy) calls are answered from the response cache when possible
+        if is_deterministic(params, chat=system_prompt is not None):
+            keys = [cache_key(provider, model_id, p if system_prompt is None else [system_prompt, p], params)
+                    for p in prompts]
+            responses = [cache_get(k) for k in keys]
+        else:
+            keys = [None] * len(prompts)
+            responses = [None] * len(prompts)
+        missing = [i for i, r in enumerate(responses) if r is None]
+        if len(missing) < len(prompts):
+            logger.debug("watsonx cache hits={}/{}", len(prompts) - len(missing), len(prompts))
+
+        if missing:
+            try:
+                token = get_iam_token(api_key)
+            except Exception as e:
+                logger.warning(f"IAM token cache unavailable ({e}); authenticating with the API key")
+                token = None
+            model = _get_watsonx_model(url, api_key, project, model_id, token)
+
+            t0 = time.time()
+            if system_prompt is not None:
+                def _chat(user_prompt: str):
+                    return call_with_retry(model.chat, messages=_chat_messages(system_prompt, user_prompt),
+                                           params=params)
+                todo = [prompts[i] for i in missing]
+                if len(todo) > 1:
+                    with ThreadPoolExecutor(max_workers=min(WATSONX_BATCH_CONCURRENCY, len(todo))) as pool:
+                        generated = list(pool.map(_chat, todo))
+                else:
+                    generated = [_chat(todo[0])]
+            elif batched:
+                generated = call_with_retry(model.generate, prompt=[prompts[i] for i in missing],
+                                            params=params, concurrency_limit=WATSONX_BATCH_CONCURRENCY)
+            else:
+                generated = [call_with_retry(model.generate, prompt=prompts[0], params=params)]
+            latency_ms = (time.time() - t0) * 1000.0
+            logger.info("watsonx.{} prompts={} latency_ms={:.1f}",
+                        "chat" if system_prompt is not None else "generate", len(missing), latency_ms)
+
+            for i, response in zip(missing, generated):
+                responses[i] = _generated_text(response)
+                if keys[i] is not None:
+                    cache_set(keys[i], responses[i])
+
+        logger.opt(lazy=True).info("watsonx_response_len chars={}", lambda: sum(map(len, responses)))
+        return responses if batched else responses[0]
 
     except Exception as e:
         logger.error(f"watsonx error: {e}\nTrace:\n{traceback.format_exc()}")
-        return f"watsonx error: {e}"
+        error = f"watsonx error: {e}"
+        return [error] * len(prompts) if batched else error
+
+
+async def aquery_watsonx(prompt: str | list[str],
+                         model_id: str = "ibm/granite-3-8b-instruct",
+                         project_id: str | None = None,
+                         system_prompt: str | None = None) -> str | list[str]:
+    """
+    Async variant of query_watsonx: the SDK call is blocking, so it runs in a worker
+    thread and many prompts can be awaited together (e.g. with asyncio.gather).
+    """
+    return await asyncio.to_thread(query_watsonx, prompt, model_id, project_id, system_prompt)
 
 
 if __name__ == "__main__":
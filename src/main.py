@@ -1,8 +1,10 @@
-from src.utils import PY, ROOT, SUBMISSIONS_PATH, GROUND_PATH, DATASETS
+from src.utils import ROOT, SUBMISSIONS_PATH, GROUND_PATH, DATASETS, DATASETS_SET
 from src.utils import LOG, log_init 
 from src.db import run_queries_to_json, db_creation
-from config import Config_Loader
-import os, sys, subprocess
+from src.utils.galois_eval import main as galois_main
+from config import get_settings
+import os, sys, asyncio
+from concurrent.futures import ThreadPoolExecutor
 
 def get_dataset_selection(database_run: str) -> list[str]:
     #  Priority to the command line
@@ -12,7 +14,7 @@ def get_dataset_selection(database_run: str) -> list[str]:
     else:
         #  Otherwise use the parameter from the .yaml file
         if database_run is None:
-            database_run = "ALL"
+            args = ["ALL"]
         else:
             args = [s.strip().upper() for s in database_run.split(",")]
 
@@ -20,18 +22,38 @@ def get_dataset_selection(database_run: str) -> list[str]:
 
     # Parameters validation
     if "ALL" in args:
-        return DATASETS
-    valid = [d for d in args if d in DATASETS]
-    invalid = [d for d in args if d not in DATASETS]
+        return list(DATASETS)
+    valid = [d for d in args if d in DATASETS_SET]
+    invalid = [d for d in args if d not in DATASETS_SET]
     if invalid:
         LOG.warning(f"Dataset '{args}' not valid. The available datasets are: {DATASETS}")
-    return valid if valid else DATASETS  # fallback with every dataset if any is valid
+    return valid if valid else list(DATASETS)  # fallback with every dataset if any is valid
 
 
 
+async def run_datasets(datasets: list[str], max_concurrency: int) -> None:
+    """
+    Two-stage pipeline: DuckDB creation (disk/CPU bound) runs on its own 2-worker pool,
+    the query stage at most `max_concurrency` datasets at a time. A dataset enters the
+    query stage as soon as its database is built, while the next ones are still building.
+    Each dataset uses its own DuckDB file, so they never share a connection.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(max(1, max_concurrency))
+
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="db_creation") as db_pool:
+        async def _one(dataset: str) -> None:
+            LOG.info("=== Processing dataset: {} ===", dataset)
+            await loop.run_in_executor(db_pool, db_creation, dataset)
+            async with sem:
+                await asyncio.to_thread(run_queries_to_json.run_queries_to_json, dataset)
+
+        await asyncio.gather(*(_one(d) for d in datasets))
+
+
 def main():
-    config = Config_Loader().get_config()
-    log_init()
+    config = get_settings()
+    log_init(config.logging.level)
     
     LOG.info(f"Logging level: {config.logging.level}")
     LOG.info(f"Output directory: {config.io.outputs_dir}")
@@ -40,23 +62,17 @@ def main():
 
     datasets = get_dataset_selection(config.database.run)
 
-    for dataset in datasets:
-        
-        LOG.info(f"=== Processing dataset: {dataset} ===")
-        db_creation(dataset)
-        run_queries_to_json.run_queries_to_json(dataset)
+    asyncio.run(run_datasets(datasets, config.execution.max_concurrency))
     
-    subprocess.run([
-        PY,
-        "-m",
-        "src.utils.galois_eval",
-        "--ground", GROUND_PATH,
-        "--submissions", SUBMISSIONS_PATH,
+    # Evaluate in-process (no second interpreter start-up / import walk)
+    galois_main(argv=[
+        "--ground", str(GROUND_PATH),
+        "--submissions", str(SUBMISSIONS_PATH),
         "--datasets", *datasets,
-        "--cell-metric similarity",
-        "--tuple-metric constraint",
-        "--format table" 
-    ], check=True)
-        
+        "--cell-metric", "similarity",
+        "--tuple-metric", "constraint",
+        "--format", "table",
+    ])
+
 if __name__ == "__main__":
     main()
@@ -1,7 +1,7 @@
-from .constants import ROOT, VENV, PY, PIP, REQS_PATH, DATA_DIR, SUBMISSIONS_PATH, GROUND_PATH, CONFIG_PATH, LOGS_DIR, DATASETS
+from .constants import ROOT, VENV, PY, PIP, REQS_PATH, DATA_DIR, SUBMISSIONS_PATH, GROUND_PATH, CONFIG_PATH, LOGS_DIR, DATASETS, DATASETS_SET, LLM_CACHE_DIR
 from .logging_config import log_init, log_query_event, LOG
 
 __all__ = [
-    "ROOT", "VENV", "PY", "PIP", "REQS_PATH", "DATA_DIR", "SUBMISSIONS_PATH", "GROUND_PATH", "CONFIG_PATH", "LOGS_DIR", "DATASETS",
+    "ROOT", "VENV", "PY", "PIP", "REQS_PATH", "DATA_DIR", "SUBMISSIONS_PATH", "GROUND_PATH", "CONFIG_PATH", "LOGS_DIR", "DATASETS", "DATASETS_SET", "LLM_CACHE_DIR",
     "log_init", "log_query_event", "LOG"
 ]
@@ -6,6 +6,7 @@ Build ground-truth by executing queries over CSVs using DuckDB.
 - Adds a few compatibility aliases (e.g., fortune1000_2024 -> fortune_2024).
 
 Requires: duckdb, pandas
+Optional: orjson (faster JSON writing, byte-identical output)
 
 Folder structure expected (as in data.zip):
   data/
@@ -15,32 +16,46 @@ Folder structure expected (as in data.zip):
 
 Outputs:
   ground/<DATASET>/query{i}.json
+
+Loaded tables are kept in one DuckDB file per dataset under --db-cache-dir
+(default: $CACHE_DIR or ~/.cache/galileo, subfolder "ground"), attached to a single
+connection. A dataset whose CSVs (name, mtime, size), source folder and loader version
+did not change since the last run is not re-ingested; --rebuild forces a fresh load.
 """
-import argparse, json, os, re, sys
+import argparse, json, math, os, re, sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import duckdb, pandas as pd
 
+from src.utils.logging_config import logger, log_init
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump when _load_csv / load_csvs_into_duckdb change how tables are built: cached DBs reload
+_LOADER_VERSION = 1
+
+def _dump_rows(rows) -> bytes:
+    # orjson writes NaN / Infinity as null: rows holding them keep the json module's output
+    if orjson is not None and not any(
+        isinstance(v, float) and not math.isfinite(v) for row in rows for v in row.values()
+    ):
+        return orjson.dumps(rows, option=orjson.OPT_INDENT_2)
+    return json.dumps(rows, ensure_ascii=False, indent=2).encode("utf-8")
+
+# Whole-line "--" comments (the line is dropped) and the statement separator,
+# which also swallows a trailing comment on the same line ("...; -- note")
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*--[^\n]*(?:\n|\Z)", re.M)
+_STMT_SPLIT_RE = re.compile(r";(?:[^\S\n]*--[^\n]*)?")
+
 def read_sql_statements(path: Path):
-    text = path.read_text(encoding="utf-8")
-    # Strip simple -- comments
-    lines = []
-    for line in text.splitlines():
-        if line.strip().startswith("--"):
-            continue
-        lines.append(line)
-    text = "\n".join(lines)
-    # Split by semicolons that terminate statements
-    # Keep robust split: newlines + ; + optional trailing comment
-    parts = [p.strip() for p in re.split(r';\s*(?:--.*)?\n', text) if p.strip()]
-    stmts = []
-    for p in parts:
-        for q in [s.strip() for s in p.split(';') if s.strip()]:
-            if q:
-                stmts.append(q)
-    # Deduplicate preserving order
+    text = _COMMENT_LINE_RE.sub("", path.read_text(encoding="utf-8"))
+    # Split once on ";", deduplicate preserving order
     out, seen = [], set()
-    for s in stmts:
-        if s not in seen:
+    for s in map(str.strip, _STMT_SPLIT_RE.split(text)):
+        if s and s not in seen:
             seen.add(s); out.append(s)
     return out
 
@@ -59,38 +74,59 @@ def find_dataset_dirs(data_root: Path):
             out[ds.name] = ds
     return out
 
-def load_csvs_into_duckdb(con: duckdb.DuckDBPyConnection, ds_dir: Path, schema: str):
+def _load_csv(con: duckdb.DuckDBPyConnection, csv_path: Path, schema: str):
+    table = csv_path.stem
+    if table == "movies":
+        # keep schema variable consistent everywhere
+        con.execute(f'''
+            CREATE SCHEMA IF NOT EXISTS "{schema}";
+            CREATE OR REPLACE TABLE "{schema}".movies(
+            primarytitle VARCHAR,
+            originaltitle VARCHAR,
+            startyear BIGINT,
+            endyear BIGINT,
+            runtimeminutes BIGINT,
+            genres VARCHAR,
+            director VARCHAR,
+            birthyear BIGINT,
+            deathyear BIGINT
+            );
+        ''')
+        # use a parameter for the path and let DuckDB handle quoting
+        con.execute(
+            f'''COPY "{schema}".movies FROM ? 
+                (FORMAT CSV, HEADER TRUE, DELIMITER ',', QUOTE '"', ESCAPE '"', NULL 'null');''',
+            [str(csv_path)]  # or csv_path.as_posix()
+        )
+    else:
+        con.execute(
+            f'CREATE OR REPLACE TABLE "{schema}"."{table}" AS '
+            'SELECT * FROM read_csv_auto(?, header=True)',
+            [str(csv_path)]
+        )
+
+def _load_csv_on_cursor(con: duckdb.DuckDBPyConnection, csv_path: Path, schema: str, catalog: str | None):
+    # Each worker gets its own cursor (a session on the same database instance)
+    cur = con.cursor()
+    try:
+        if catalog:
+            cur.execute(f'USE "{catalog}"')  # the default catalog is per session
+        _load_csv(cur, csv_path, schema)
+    finally:
+        cur.close()
+
+def load_csvs_into_duckdb(con: duckdb.DuckDBPyConnection, ds_dir: Path, schema: str, catalog: str | None = None):
     con.execute(f'CREATE SCHEMA IF NOT EXISTS "{schema}"')
-    for csv_path in sorted(ds_dir.glob("*.csv")):
-        table = csv_path.stem
-        if table == "movies":
-            # keep schema variable consistent everywhere
-            con.execute(f'''
-                CREATE SCHEMA IF NOT EXISTS "{schema}";
-                CREATE OR REPLACE TABLE "{schema}".movies(
-                primarytitle VARCHAR,
-                originaltitle VARCHAR,
-                startyear BIGINT,
-                endyear BIGINT,
-                runtimeminutes BIGINT,
-                genres VARCHAR,
-                director VARCHAR,
-                birthyear BIGINT,
-                deathyear BIGINT
-                );
-            ''')
-            # use a parameter for the path and let DuckDB handle quoting
-            con.execute(
-                f'''COPY "{schema}".movies FROM ? 
-                    (FORMAT CSV, HEADER TRUE, DELIMITER ',', QUOTE '"', ESCAPE '"', NULL 'null');''',
-                [str(csv_path)]  # or csv_path.as_posix()
-            )
-        else:
-            con.execute(
-                f'CREATE OR REPLACE TABLE "{schema}"."{table}" AS '
-                'SELECT * FROM read_csv_auto(?, header=True)',
-                [str(csv_path)]
-            )
+    csv_paths = sorted(ds_dir.glob("*.csv"))
+    if len(csv_paths) < 2:
+        for csv_path in csv_paths:
+            _load_csv(con, csv_path, schema)
+        return
+    # One table per file: parse the CSVs concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(csv_paths))) as pool:
+        futures = [pool.submit(_load_csv_on_cursor, con, p, schema, catalog) for p in csv_paths]
+        for fut in futures:
+            fut.result()  # surface the first load error, as the serial loop did
 
 def add_compat_aliases(con: duckdb.DuckDBPyConnection, schema: str, dataset_name: str):
     # Aliases needed because some SQLs reference slightly different table names than CSV file names.
@@ -104,42 +140,76 @@ def add_compat_aliases(con: duckdb.DuckDBPyConnection, schema: str, dataset_name
     for alias, real in aliases:
         # Create view alias only if real table exists
         exists = con.execute(
-            "SELECT 1 FROM information_schema.tables WHERE table_schema=? AND table_name=?",
+            "SELECT 1 FROM information_schema.tables "
+            "WHERE table_catalog=current_database() AND table_schema=? AND table_name=?",
             [schema, real]
         ).fetchone()
         if exists:
             con.execute(f'CREATE OR REPLACE VIEW "{schema}"."{alias}" AS SELECT * FROM "{schema}"."{real}"')
 
-def main():
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--data-root", type=Path, required=True)
-    ap.add_argument("--ground-root", type=Path, required=True)
-    ap.add_argument("--datasets", nargs="*", default=None)
-    ap.add_argument("--schema-name", default="target", help='DuckDB schema to load tables into (default: "target")')
-    args = ap.parse_args()
+def _default_db_cache_dir() -> Path:
+    base = os.getenv("CACHE_DIR")
+    return (Path(base) if base else Path.home() / ".cache" / "galileo") / "ground"
 
-    ds_dirs = find_dataset_dirs(args.data_root)
-    if args.datasets:
-        ds_dirs = {k:v for k,v in ds_dirs.items() if k in args.datasets}
+def _csv_signature(ds_dir: Path, schema: str):
+    src = str(ds_dir.resolve())  # same dataset name from another data root → different tables
+    rows = []
+    for p in sorted(ds_dir.glob("*.csv")):
+        st = p.stat()
+        rows.append((_LOADER_VERSION, src, schema, p.name, st.st_mtime_ns, st.st_size))
+    return rows
 
-    for ds_name, ds_dir in ds_dirs.items():
-        qfiles = list(ds_dir.glob("queries_*.sql"))
-        if not qfiles:
-            print(f"[WARN] No queries_*.sql in {ds_dir}; skipping")
-            continue
-        qpath = sorted(qfiles)[0]
-        sqls = read_sql_statements(qpath)
-        if not sqls:
-            print(f"[WARN] No SQL statements in {qpath}")
-            continue
+def attach_dataset_db(con: duckdb.DuckDBPyConnection, cache_dir: Path, ds_name: str) -> str:
+    """
+    Attach <cache_dir>/<ds_name>.duckdb and make it the default catalog; returns its alias.
+    """
+    catalog = "ground_" + re.sub(r"\W", "_", ds_name.lower())
+    db_file = str(cache_dir / f"{ds_name}.duckdb").replace("'", "''")
+    con.execute(f"ATTACH '{db_file}' AS \"{catalog}\"")
+    con.execute(f'USE "{catalog}"')
+    return catalog
+
+def is_loaded(con: duckdb.DuckDBPyConnection, signature) -> bool:
+    # _ground_signature records the loader, source folder and CSV versions the tables were built from
+    con.execute("CREATE TABLE IF NOT EXISTS main._ground_signature"
+                "(loader_version INTEGER, ds_dir VARCHAR, schema_name VARCHAR, csv_name VARCHAR,"
+                " mtime_ns BIGINT, size BIGINT)")
+    stored = con.execute("SELECT * FROM main._ground_signature").fetchall()
+    return bool(signature) and sorted(stored) == sorted(signature)
+
+def mark_loaded(con: duckdb.DuckDBPyConnection, signature):
+    con.execute("DROP TABLE IF EXISTS main._ground_csvs")  # pre-_LOADER_VERSION signature table
+    con.execute("DELETE FROM main._ground_signature")
+    con.executemany("INSERT INTO main._ground_signature VALUES (?, ?, ?, ?, ?, ?)", signature)
 
-        out_dir = args.ground_root / ds_name.upper()
-        out_dir.mkdir(parents=True, exist_ok=True)
+def _build_dataset(con: duckdb.DuckDBPyConnection, args, ds_name: str, ds_dir: Path):
+    """
+    Write ground/<DATASET>/query{i}.json for one dataset, (re)loading its tables only if needed.
+    """
+    qfiles = list(ds_dir.glob("queries_*.sql"))
+    if not qfiles:
+        logger.warning("No queries_*.sql in {}; skipping", ds_dir)
+        return
+    qpath = sorted(qfiles)[0]
+    sqls = read_sql_statements(qpath)
+    if not sqls:
+        logger.warning("No SQL statements in {}", qpath)
+        return
 
-        con = duckdb.connect()
-        # Load CSVs into the target schema
-        schema = args.schema_name
-        load_csvs_into_duckdb(con, ds_dir, schema)
+    out_dir = args.ground_root / ds_name.upper()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    schema = args.schema_name
+    catalog = attach_dataset_db(con, args.db_cache_dir, ds_name)
+    try:
+        signature = _csv_signature(ds_dir, schema)
+        if not args.rebuild and is_loaded(con, signature):
+            logger.info("{}: tables up to date in {}", ds_name, args.db_cache_dir)
+        else:
+            con.execute(f'DROP SCHEMA IF EXISTS "{schema}" CASCADE')
+            # Load CSVs into the target schema
+            load_csvs_into_duckdb(con, ds_dir, schema, catalog)
+            mark_loaded(con, signature)
         # Add dataset-specific aliases
         add_compat_aliases(con, schema, ds_name)
 
@@ -148,15 +218,47 @@ def main():
                 df = con.execute(sql).df()
                 rows = df.to_dict(orient="records")
             except Exception as e:
-                print(f"[ERROR] {ds_name} q{i}: {e}\n")
+                logger.error("{} q{}: {}", ds_name, i, e)
                 rows = []
-            (out_dir / f"query{i}.json").write_text(json.dumps(rows, ensure_ascii=False, indent=2), encoding="utf-8")
-            print(f"[OK] {ds_name} query{i}: {len(rows)} rows")
+            # pandas keeps the ground-truth typing (e.g. sum() → float); only the encoder changes
+            (out_dir / f"query{i}.json").write_bytes(_dump_rows(rows))
+            # per-query line: only formatted with --verbose
+            logger.debug("{} query{}: {} rows", ds_name, i, len(rows))
+    finally:
+        con.execute("USE memory")
+        con.execute(f'DETACH "{catalog}"')
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--data-root", type=Path, required=True)
+    ap.add_argument("--ground-root", type=Path, required=True)
+    ap.add_argument("--datasets", nargs="*", default=None)
+    ap.add_argument("--schema-name", default="target", help='DuckDB schema to load tables into (default: "target")')
+    ap.add_argument("--db-cache-dir", type=Path, default=_default_db_cache_dir(),
+                    help="Where the per-dataset DuckDB files are kept between runs")
+    ap.add_argument("--rebuild", action="store_true", help="Re-ingest the CSVs even if they did not change")
+    ap.add_argument("-v", "--verbose", action="store_true", help="Print one [OK] line per query")
+    args = ap.parse_args()
+    log_init("DEBUG" if args.verbose else "INFO")
+    args.db_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    ds_dirs = find_dataset_dirs(args.data_root)
+    if args.datasets:
+        ds_dirs = {k:v for k,v in ds_dirs.items() if k in args.datasets}
+
+    # One warm connection; every dataset lives in its own attached file
+    con = duckdb.connect()
+    try:
+        for ds_name, ds_dir in ds_dirs.items():
+            _build_dataset(con, args, ds_name, ds_dir)
+    finally:
         con.close()
 
+
 if __name__ == "__main__":
     try:
         main()
     except duckdb.IOException as e:
-        print("DuckDB I/O error:", e, file=sys.stderr)
+        logger.error("DuckDB I/O error: {}", e)
         sys.exit(1)
@@ -1,22 +1,22 @@
-def build_prompt_context(dataset_name: str):
-    if(dataset_name.upper()=="FLIGHT-2"):
-        schema = """
+from functools import cache
+
+# Dataset schemas, keyed by dataset name (upper case)
+_SCHEMAS: dict[str, str] = {
+    "FLIGHT-2": """
                 Dataset: flight information.
                 Tables:
                     - usa_airlines_company(uid, airline, call_sign, country)
                     - usa_airports(city, airportcode, airportname, country, countryabbrev)
                     - usa_flights(airline, flightno, sourceairport, destairport)
-                """
-    elif(dataset_name.upper()=="FLIGHT-4"):
-        schema = """
+                """,
+    "FLIGHT-4": """
                 Dataset: flight information.
                 Tables:
                     - airlines(alid, name, iata, icao, callsign, country, active)
                     - airports(apid, name, city, country, x, y, elevation_in_ft, iata, icao)
                     - routes(rid, dst_apid, dst_ap, src_apid, src_ap, alid, airline, codeshare)
-                """
-    elif (dataset_name.upper() == "FORTUNE"):
-        schema = """
+                """,
+    "FORTUNE": """
                 Dataset: Fortune 1000 companies (2024).
                 Tables:
                     - fortune_2024(
@@ -28,10 +28,8 @@ def build_prompt_context(dataset_name: str):
                         Assets_M, CEO, Country, HeadquartersCity, HeadquartersState, Website, 
                         CompanyType, Footnote, MarketCap_Updated_M, Updated
                         )
-                """
-
-    elif (dataset_name.upper() == "GEO"):
-            schema = """
+                """,
+    "GEO": """
                     Dataset: geographical information about the United States.
                     Tables:
                         - usa_border_info(state_name, border)
@@ -41,18 +39,16 @@ def build_prompt_context(dataset_name: str):
                         - usa_mountain(mountain_name, mountain_altitude_in_meters, country_name, state_name)
                         - usa_river(river_name, length_in_km, country_name, usa_state_traversed)
                         - usa_state(state_name, population, area_squared_miles, country_name, capital, density)
-                    """
-    elif (dataset_name.upper() == "MOVIES"):
-        schema = """
+                    """,
+    "MOVIES": """
                 Dataset: movie information including titles, years, genres, and directors.
                 Tables:
                     - movies(
                         primarytitle, originaltitle, startyear, endyear, runtimeminutes, 
                         genres, director, birthyear, deathyear
                     )
-                """
-    elif (dataset_name.upper() == "PREMIER"):
-        schema = """
+                """,
+    "PREMIER": """
                 Dataset: Premier League 2024–2025 season information.
                 Tables:
                     - premier_league_2024_2025_arsenal_matches(
@@ -65,17 +61,15 @@ def build_prompt_context(dataset_name: str):
                         oid, date, home_team, away_team, home_goals, away_goals, 
                         player_of_the_match, player_of_the_match_team
                     )
-                """
-    elif (dataset_name.upper() == "PRESIDENTS"):
-        schema = """
+                """,
+    "PRESIDENTS": """
                 Dataset: world presidents information.
                 Tables:
                     - world_presidents(
                         name, start_year, end_year, cardinal_number, party, country
                     )
-                """
-    elif (dataset_name.upper() == "WORLD"):
-        schema = """
+                """,
+    "WORLD": """
                 Dataset: world countries, cities, and languages information.
                 Tables:
                     - city(
@@ -89,11 +83,14 @@ def build_prompt_context(dataset_name: str):
                     - country_language(
                         country_code_3_letters, language, is_official, percentage
                     )
-                """
-    else:
-        schema = "Generic dataset"
+                """,
+}
 
-    prompt = f"""
+
+def _wrap(schema: str) -> str:
+    # Static instructions + schema only: the per-query question is appended after it by the caller,
+    # so every request of a dataset shares the same prefix (provider-side prompt caching)
+    return f"""
     You are an assistant that answers questions base on this dataset:
     {schema}
     Answer only in JSON format like the following:
@@ -106,6 +103,12 @@ def build_prompt_context(dataset_name: str):
         "tokens": number
     }}"""
 
-    return prompt
+
+# Prompts are built once at import; a call is a dict lookup
+_PROMPTS: dict[str, str] = {name: _wrap(schema) for name, schema in _SCHEMAS.items()}
+_GENERIC_PROMPT = _wrap("Generic dataset")
 
 
+@cache  # keyed by the name as passed; a hit also skips the .upper()
+def build_prompt_context(dataset_name: str) -> str:
+    return _PROMPTS.get(dataset_name.upper(), _GENERIC_PROMPT)
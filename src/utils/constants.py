@@ -1,29 +1,30 @@
-import os
+import sys
 from pathlib import Path
+from typing import Final
 
 
-ROOT = Path(__file__).resolve().parent.parent.parent
-VENV = ROOT / ".venv"
+ROOT: Final[Path] = Path(__file__).resolve().parents[2]
+VENV: Final[Path] = ROOT / ".venv"
 
-CONFIG_PATH = ROOT / "config" / "config.yaml"
+CONFIG_PATH: Final[Path] = ROOT / "config" / "config.yaml"
 
-DATA_DIR = ROOT / "data"
+DATA_DIR: Final[Path] = ROOT / "data"
 
-PROMPTS = ROOT / "data" / ".prompts"
+PROMPTS: Final[Path] = ROOT / "data" / ".prompts"
 
-SUBMISSIONS_PATH = ROOT / "data" / ".output"
+SUBMISSIONS_PATH: Final[Path] = ROOT / "data" / ".output"
 
-GROUND_PATH = ROOT / "data" / ".ground_truth"
+GROUND_PATH: Final[Path] = ROOT / "data" / ".ground_truth"
 
-DATASETS = ["FLIGHT-2", "FLIGHT-4", "FORTUNE", "GEO", "MOVIES", "PREMIER", "PRESIDENTS", "WORLD"]
+LLM_CACHE_DIR: Final[Path] = ROOT / "data" / ".llm_cache"
 
-if(os.name == "nt"):
-    PIP = VENV / "Scripts" / "pip"
-    PY  = VENV / "Scripts" / "python"
-else:
-    PIP = VENV / "bin" / "pip"
-    PY  = VENV / "bin" / "python"
+DATASETS: Final[tuple[str, ...]] = ("FLIGHT-2", "FLIGHT-4", "FORTUNE", "GEO", "MOVIES", "PREMIER", "PRESIDENTS", "WORLD")
+DATASETS_SET: Final[frozenset[str]] = frozenset(DATASETS)  # O(1) membership checks
 
-LOGS_DIR = ROOT / "logs"
+_VENV_BIN = "Scripts" if sys.platform == "win32" else "bin"
+PIP: Final[Path] = VENV / _VENV_BIN / "pip"
+PY: Final[Path] = VENV / _VENV_BIN / "python"
 
-REQS_PATH = ROOT / "requirements.txt"
+LOGS_DIR: Final[Path] = ROOT / "logs"
+
+REQS_PATH: Final[Path] = ROOT / "requirements.txt"
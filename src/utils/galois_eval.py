@@ -8,31 +8,30 @@ Key speedups:
 - Faster F1-cell(sililarity): numeric matching via binary search; string matching via bucketed candidates
 - Faster tuple similarity: bucket by (row length, multiplicity) + cached per-cell similarity
 - Optional multiprocessing across datasets: --jobs N
-- Optional fast JSON via orjson (if installed)
+- Optional fast JSON via orjson (if installed); CSV via the pandas C parser (if installed)
 
 CLI is compatible with the original, with one addition:
   --jobs N     (default 1) run datasets in parallel
 """
 from __future__ import annotations
-import argparse, csv, json, math, re, sys
+import argparse, csv, json, math, os, re, sys
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Set, Optional, Iterable
 from collections import Counter, defaultdict
 from functools import lru_cache
-from bisect import bisect_left, bisect_right
 from concurrent.futures import ProcessPoolExecutor, as_completed
 
+try:
+    import numpy as np  # vectorized numeric cell matching
+except ImportError:
+    np = None
+
 
 def _eval_query_once(args):
-    # args: (qid, gt_path_str, sub_dir_str_or_none, gt_suffix, cell_mode, tuple_mode)
-    qid, gt_path_str, sub_dir_str, gt_sfx, cell_mode, tuple_mode = args
+    # args: (qid, gt_path_str, pr_path_str_or_none, cell_mode, tuple_mode)
+    qid, gt_path_str, pr_path_str, cell_mode, tuple_mode = args
     gt_path = Path(gt_path_str)
-    sub_dir = (Path(sub_dir_str) if sub_dir_str else None)
-
-    pr_path = (sub_dir / (qid + gt_sfx)) if sub_dir else None
-    if pr_path and not pr_path.exists():
-        alt = sub_dir / (qid + (".json" if gt_sfx.lower()==".csv" else ".csv"))
-        pr_path = alt if alt.exists() else None
+    pr_path = Path(pr_path_str) if pr_path_str else None
 
     gt_cols, gt_rows = read_table_file(gt_path)
     pr_cols, pr_rows, q_tokens, q_time = read_submission_file(pr_path)
@@ -53,19 +52,33 @@ def _eval_query_once(args):
         tcon = tuple_constraint(gt_rows, pr_rows)
 
     avg = (f1 + card + tcon) / 3.0
-    return (f1, card, tcon, avg, q_tokens, q_time)
+    return (f1, card, tcon, avg, q_tokens, q_time, _take_new_norms())
 
 # -------- Optional fast JSON loader --------
+try:
+    import orjson  # type: ignore  # imported once here, so forked workers inherit it
+except ImportError:
+    orjson = None
+
 def _json_load_fast(path: Path) -> Any:
     try:
-        import orjson  # type: ignore
         return orjson.loads(path.read_bytes())
     except Exception:
         return json.load(path.open("r", encoding="utf-8"))
 
 # ---------------- I/O ----------------
+def _read_csv_rows(path: Path) -> List[List[str]]:
+    # pandas' C tokenizer when available (all cells as str, nothing turned into NaN); blank lines are
+    # kept as rows of "" like the padded csv rows. Ragged/empty files fall back to csv.reader.
+    try:
+        import pandas as pd  # type: ignore
+        return pd.read_csv(path, header=None, dtype=str, keep_default_na=False, na_filter=False,
+                           skip_blank_lines=False, encoding="utf-8-sig", engine="c").values.tolist()
+    except Exception:
+        return list(csv.reader(path.open("r", encoding="utf-8-sig", newline="")))
+
 def _read_csv(path: Path) -> Tuple[List[str], List[List[Any]]]:
-    rows = list(csv.reader(path.open("r", encoding="utf-8-sig", newline="")))
+    rows = _read_csv_rows(path)
     if not rows: return [], []
     cols = [c.strip() for c in rows[0]]
     W = len(cols)
@@ -87,13 +100,13 @@ def _parse_table_from_obj(obj: Any) -> Tuple[List[str], List[List[Any]]]:
                     rows.append([row[i] if i < len(row) else "" for i in range(len(cols))])
             return cols, rows
         if "tuples" in obj and isinstance(obj["tuples"], list):
-            cols = sorted({k for t in obj["tuples"] for k in (t.keys() if isinstance(t, dict) else [])})
+            cols = sorted(set().union(*(t for t in obj["tuples"] if isinstance(t, dict))))
             rows = [[t.get(c, "") for c in cols] for t in obj["tuples"] if isinstance(t, dict)]
             return cols, rows
         if "data" in obj and isinstance(obj["data"], list):
             arr = obj["data"]
             if arr and isinstance(arr[0], dict):
-                cols = sorted({k for t in arr for k in t.keys()})
+                cols = sorted(set().union(*arr))  # key views merged in C, no per-key loop
                 rows = [[t.get(c, "") for c in cols] for t in arr]
                 return cols, rows
             if arr and isinstance(arr[0], list):
@@ -105,7 +118,7 @@ def _parse_table_from_obj(obj: Any) -> Tuple[List[str], List[List[Any]]]:
     if isinstance(obj, list):
         if not obj: return [], []
         if isinstance(obj[0], dict):
-            cols = sorted({k for t in obj for k in t.keys()})
+            cols = sorted(set().union(*obj))
             rows = [[t.get(c, "") for c in cols] for t in obj]
             return cols, rows
         if isinstance(obj[0], list):
@@ -140,6 +153,8 @@ def _to_float(x: Any) -> Optional[float]:
     return None
 
 def read_submission_file(path: Optional[Path]) -> Tuple[List[str], List[List[Any]], Optional[float], Optional[float]]:
+    # path is None when there is no submission (resolved by the caller's directory listing);
+    # other callers may pass a path that does not exist, which also counts as no submission
     if not path or not path.exists():
         return [], [], None, None
     s = path.suffix.lower()
@@ -160,33 +175,90 @@ def read_submission_file(path: Optional[Path]) -> Tuple[List[str], List[List[Any
 _million = re.compile(r'(\d+(?:\.\d+)?)\s*(million|m)\b', re.I)
 _billion = re.compile(r'(\d+(?:\.\d+)?)\s*(billion|b)\b', re.I)
 _thousand = re.compile(r'(\d+(?:\.\d+)?)\s*(thousand|k)\b', re.I)
+# all three in one scan; lastgroup names the scale that matched
+_SCALE = re.compile(r'(\d+(?:\.\d+)?)\s*(?:(?P<m>million|m)|(?P<b>billion|b)|(?P<k>thousand|k))\b', re.I)
 _numeric = re.compile(r'^-?\d+(\.\d+)?$')
 
 @lru_cache(maxsize=200_000)
 def _normalize_string(cell_as_string: str) -> str:
-    s2 = cell_as_string.replace(",", "")
-    m = _million.search(s2)
-    if m:  return f"{float(m.group(1))*1_000_000:.0f}"
-    m = _billion.search(s2)
-    if m:  return f"{float(m.group(1))*1_000_000_000:.0f}"
-    m = _thousand.search(s2)
-    if m:  return f"{float(m.group(1))*1_000:.0f}"
+    s2 = cell_as_string.replace(",", "") if "," in cell_as_string else cell_as_string
+    m = _SCALE.search(s2)
+    if m:
+        # million wins over billion over thousand wherever they appear (rare: several scales in one cell)
+        kind = m.lastgroup
+        if kind != "m" and (m2 := _million.search(s2)):
+            m, kind = m2, "m"
+        elif kind == "k" and (m2 := _billion.search(s2)):
+            m, kind = m2, "b"
+        if kind == "m": return f"{float(m.group(1))*1_000_000:.0f}"
+        if kind == "b": return f"{float(m.group(1))*1_000_000_000:.0f}"
+        return f"{float(m.group(1))*1_000:.0f}"
     s3 = s2.strip()
     if _numeric.match(s3):
         v = float(s3)
         return f"{v:.2f}" if "." in s3 else f"{v:.0f}"
     return cell_as_string.replace("\n", "").strip().lower()
 
+# --norm-cache: normalizations persisted across runs (None = disabled, plain LRU only).
+# Entries computed in this process since the last _take_new_norms() are also kept in _NORM_NEW
+# so workers can send them back to the parent, which writes the file.
+NORM_CACHE_VERSION = 1
+NORM_CACHE_MAX = 1_000_000
+_NORM_CACHE: Optional[Dict[str, str]] = None
+_NORM_NEW: Dict[str, str] = {}
+
 def norm(v: Any) -> str:
-    return _normalize_string(str(v))
+    s = str(v)
+    if _NORM_CACHE is None:
+        return _normalize_string(s)
+    r = _NORM_CACHE.get(s)
+    if r is None:
+        r = _NORM_CACHE[s] = _NORM_NEW[s] = _normalize_string(s)
+    return r
+
+def _set_norm_cache(entries: Optional[Dict[str, str]]) -> None:
+    # also the worker initializer: with fork the dict is inherited, not pickled
+    global _NORM_CACHE
+    _NORM_CACHE = entries
+
+def _take_new_norms() -> Optional[Dict[str, str]]:
+    if _NORM_CACHE is None:
+        return None
+    out = dict(_NORM_NEW)
+    _NORM_NEW.clear()
+    return out
+
+def load_norm_cache(path: Path) -> Dict[str, str]:
+    try:
+        obj = _json_load_fast(path)
+        if obj.get("v") == NORM_CACHE_VERSION and isinstance(obj.get("entries"), dict):
+            return obj["entries"]
+    except Exception:
+        pass  # missing / stale / corrupt: start empty
+    return {}
+
+def save_norm_cache(path: Path, entries: Dict[str, str]) -> None:
+    if len(entries) > NORM_CACHE_MAX:  # keep the newest (insertion order: loaded first, then this run)
+        entries = dict(list(entries.items())[-NORM_CACHE_MAX:])
+    obj = {"v": NORM_CACHE_VERSION, "entries": entries}
+    data = orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
 
 # -------------- Edit distance + similarity (cached) --------------
+# C backends are called directly: they beat an lru_cache lookup, so only the pure-Python DP is cached
 try:
     # optional speedup if installed
-    from Levenshtein import distance as _lev_distance  # type: ignore
-    def _edit_distance(a: str, b: str) -> int:
-        return _lev_distance(a, b)
+    from Levenshtein import distance as _edit_distance  # type: ignore
 except Exception:
+    try:
+        from editdistance import eval as _edit_distance  # type: ignore  # pip install editdistance
+    except Exception:
+        _edit_distance = None
+
+if _edit_distance is None:
     @lru_cache(maxsize=200_000)
     def _edit_distance(a: str, b: str) -> int:
         if a == b: return 0
@@ -220,17 +292,30 @@ except Exception:
             return False
         return _edit_distance(a, b) <= k
 
+try:
+    from rapidfuzz.process import cdist as _cdist  # whole distance matrices in C
+except Exception:
+    _cdist = None
+_CDIST_THREADED_MIN = 100_000  # matrix cells; smaller ones are not worth the thread start-up
+
+@lru_cache(maxsize=200_000)
+def _as_float(cell: str) -> Optional[float]:
+    # each cell is classified numeric/text once, instead of a float() attempt (and raise) per pair
+    try:
+        return float(cell.replace(",", "."))
+    except ValueError:
+        return None
+
 @lru_cache(maxsize=500_000)
 def _cells_similar_default(a: str, b: str) -> bool:
     # numeric branch (±10%)
-    try:
-        ev = float(a.replace(",", "."))
-        rv = float(b.replace(",", "."))
-        if ev == 0.0:
-            return abs(rv) <= 0.1
-        return abs((ev - rv) / ev) <= 0.1
-    except Exception:
-        pass
+    ev = _as_float(a)
+    if ev is not None:
+        rv = _as_float(b)
+        if rv is not None:
+            if ev == 0.0:
+                return abs(rv) <= 0.1
+            return abs((ev - rv) / ev) <= 0.1
 
     # string branch: exact 10% edit-distance rule with safe length pre-check + early-exit DP
     k = int(math.floor(len(a) * 0.10))
@@ -276,62 +361,169 @@ def f1_cell_exact(gt_cols, gt_rows, pr_cols, pr_rows) -> float:
     rec  = inter/len(gt)
     return 0.0 if (prec+rec)==0 else 2*prec*rec/(prec+rec)
 
-def _partition_numeric(strings: Iterable[str]) -> Tuple[List[float], List[str]]:
+def _partition_numeric(strings: Iterable[str]) -> Tuple[List[str], List[float], List[str]]:
+    # numeric cells (as strings + parsed values, NaN/inf included) and the non-numeric rest
+    num_strs: List[str] = []
     nums: List[float] = []
     txts: List[str] = []
     for s in strings:
-        try:
-            nums.append(float(s.replace(",", ".")))
-        except Exception:
+        v = _as_float(s)
+        if v is None:
             txts.append(s)
-    return nums, txts
-
-def _count_numeric_matches(pr_nums_sorted: List[float], gt_nums_sorted: List[float]) -> Tuple[int,int]:
-    # Count how many pr numbers have a gt within ±10% (precision count),
-    # and how many gt numbers have a pr within ±10% (recall count).
-    def has_within(sorted_vals: List[float], x: float) -> bool:
-        if x == 0.0:
-            # accept |y| <= 0.1
-            lo, hi = -0.1, 0.1
         else:
-            lo = x/1.1
-            hi = x*1.1
-        L = bisect_left(sorted_vals, lo)
-        R = bisect_right(sorted_vals, hi)
-        return R > L
-
-    p_count = sum(1 for x in pr_nums_sorted if has_within(gt_nums_sorted, x))
-    r_count = sum(1 for x in gt_nums_sorted if has_within(pr_nums_sorted, x))
-    return p_count, r_count
-
-def _build_string_buckets(values: Iterable[str]) -> Dict[Tuple[str,int], List[str]]:
-    # bucket by (first_char_or_empty, length_bin)
-    buckets: Dict[Tuple[str,int], List[str]] = defaultdict(list)
+            nums.append(v)
+            num_strs.append(s)
+    return num_strs, nums, txts
+
+def _num_close(ev: float, rv: float) -> bool:
+    # numeric branch of _cells_similar_default, on already-parsed values
+    if ev == 0.0:
+        return abs(rv) <= 0.1
+    return abs((ev - rv) / ev) <= 0.1
+
+def _numeric_hits(xs: List[float], others: List[float], x_is_expected: bool) -> List[bool]:
+    """
+    For each x: is there a y in `others` within ±10% (relative to the expected side)?
+    Vectorized with np.searchsorted: a non-empty window shrunk by a tiny pad is a sure hit,
+    a window that is non-empty only once widened is re-checked with _num_close, so the
+    result is exactly the one of the pairwise loop. NaN/inf never match.
+    """
+    if np is None:
+        if x_is_expected:
+            return [any(_num_close(x, y) for y in others) for x in xs]
+        return [any(_num_close(y, x) for y in others) for x in xs]
+
+    ys = np.asarray(others, dtype=np.float64)
+    ys = np.sort(ys[np.isfinite(ys)])
+    x = np.asarray(xs, dtype=np.float64)
+    finite = np.isfinite(x)
+    ax = np.abs(x)
+    with np.errstate(all="ignore"):
+        if x_is_expected:
+            # y within [x - 0.1|x|, x + 0.1|x|], or |y| <= 0.1 when x == 0
+            lo = np.where(x == 0.0, -0.1, x - 0.1 * ax)
+            hi = np.where(x == 0.0, 0.1, x + 0.1 * ax)
+        else:
+            # expected y with |y - x| <= 0.1|y|  <=>  y between x/1.1 and x/0.9
+            a, b = x / 1.1, x / 0.9
+            lo, hi = np.minimum(a, b), np.maximum(a, b)
+        pad = 1e-9 * ax + 1e-12
+        sure = np.searchsorted(ys, hi - pad, side="right") > np.searchsorted(ys, lo + pad, side="left")
+        L = np.searchsorted(ys, lo - pad, side="left")
+        R = np.searchsorted(ys, hi + pad, side="right")
+    if not x_is_expected and ys.size and ys[0] <= 0.0 <= ys[-1] and (ys == 0.0).any():
+        sure |= ax <= 0.1  # an expected 0 matches any |x| <= 0.1
+    sure &= finite
+
+    out = sure.tolist()
+    for k in np.flatnonzero(finite & ~sure & (R > L)).tolist():
+        xk = xs[k]
+        window = ys[L[k]:R[k]].tolist()
+        if x_is_expected:
+            out[k] = any(_num_close(xk, y) for y in window)
+        else:
+            out[k] = any(_num_close(y, xk) for y in window)
+    return out
+
+def _build_string_buckets(values: Iterable[str]) -> Dict[int, List[str]]:
+    # bucket by length: the edit-distance rule only accepts |len(a)-len(b)| <= floor(len(expected)*0.1)
+    buckets: Dict[int, List[str]] = defaultdict(list)
     for s in values:
-        first = s[0] if s else ""
-        buckets[(first, len(s)//2)].append(s)
+        buckets[len(s)].append(s)
     return buckets
 
+def _any_similar_result(ec: str, pr_by_len: Dict[int, List[str]]) -> bool:
+    # some result cell within the length window of expected cell `ec`
+    n, k = len(ec), len(ec) // 10
+    for L in range(n - k, n + k + 1):
+        for rc in pr_by_len.get(L, ()):
+            if _cells_similar_default(ec, rc):
+                return True
+    return False
+
+def _any_similar_expected(rc: str, gt_by_len: Dict[int, List[str]]) -> bool:
+    # some expected cell of length L with |L - len(rc)| <= L // 10 (range slightly wider, checked exactly)
+    n = len(rc)
+    for L in range(max(0, n * 10 // 11 - 1), n * 10 // 9 + 2):
+        for ec in gt_by_len.get(L, ()):
+            if _cells_similar_default(ec, rc):
+                return True
+    return False
+
+def _string_hits_cdist(gt_nstr: List[str], gt_txt: List[str],
+                       pr: List[str], pr_txt: List[str]) -> Tuple[Set[str], Set[str]]:
+    """
+    (expected cells, result cells) having an edit-distance match on the other side, over every
+    pair where at least one cell is non-numeric. One cdist call per expected length L, against
+    the result cells in the L ± L//10 window, all sharing the threshold k = L//10.
+    """
+    gt_hit: Set[str] = set()
+    pr_hit: Set[str] = set()
+    pr_by_len, pr_txt_by_len = _build_string_buckets(pr), _build_string_buckets(pr_txt)
+    for cells, cand_by_len in ((gt_txt, pr_by_len), (gt_nstr, pr_txt_by_len)):
+        for L, ecs in _build_string_buckets(cells).items():
+            k = L // 10
+            cands = [rc for n in range(L - k, L + k + 1) for rc in cand_by_len.get(n, ())]
+            if not cands:
+                continue
+            workers = -1 if len(ecs) * len(cands) >= _CDIST_THREADED_MIN else 1
+            ok = _cdist(ecs, cands, scorer=RFLev.distance, score_cutoff=k, workers=workers) <= k
+            gt_hit.update(ec for ec, hit in zip(ecs, ok.any(axis=1).tolist()) if hit)
+            pr_hit.update(rc for rc, hit in zip(cands, ok.any(axis=0).tolist()) if hit)
+    return gt_hit, pr_hit
+
+def _matches_itself(cell: str) -> bool:
+    # identical cells are similar, except NaN/inf numbers (the ±10% rule never accepts them)
+    v = _as_float(cell)
+    return v is None or math.isfinite(v)
+
 def f1_cell_similarity(gt_cols, gt_rows, pr_cols, pr_rows) -> float:
     # Java-faithful semantics (same as your original), but fast via cached _cells_similar_default
-    gt = list(cells_set(gt_cols, gt_rows))
-    pr = list(cells_set(pr_cols, pr_rows))
-    if not gt and not pr: return 1.0
-    if not gt or not pr:  return 0.0
+    gt_set = cells_set(gt_cols, gt_rows)
+    pr_set = cells_set(pr_cols, pr_rows)
+    if not gt_set and not pr_set: return 1.0
+    if not gt_set or not pr_set:  return 0.0
+    gt, pr = list(gt_set), list(pr_set)
+
+    # Cells present on both sides trivially have a match: only the residuals are searched
+    shared = {c for c in gt_set & pr_set if _matches_itself(c)}
+
+    # Numeric pairs only ever use the ±10% rule: they are matched in bulk by _numeric_hits.
+    # Pairs involving a non-numeric cell go through _cells_similar_default (edit distance).
+    gt_nstr, gt_nums, gt_txt = _partition_numeric(gt)
+    pr_nstr, pr_nums, pr_txt = _partition_numeric(pr)
+
+    # Numeric hits first; only the cells still unmatched need the edit-distance search
+    rest = [(rc, rv) for rc, rv in zip(pr_nstr, pr_nums) if rc not in shared]
+    p_hits = _numeric_hits([rv for _, rv in rest], gt_nums, x_is_expected=False)
+    pr_need_num = [rc for (rc, _), hit in zip(rest, p_hits) if not hit]
+    pr_need_txt = [rc for rc in pr_txt if rc not in shared]
+
+    rest = [(ec, ev) for ec, ev in zip(gt_nstr, gt_nums) if ec not in shared]
+    r_hits = _numeric_hits([ev for _, ev in rest], pr_nums, x_is_expected=True)
+    gt_need_num = [ec for (ec, _), hit in zip(rest, r_hits) if not hit]
+    gt_need_txt = [ec for ec in gt_txt if ec not in shared]
+
+    if _cdist is not None and np is not None:
+        if pr_need_num or pr_need_txt or gt_need_num or gt_need_txt:
+            gt_str_hit, pr_str_hit = _string_hits_cdist(gt_nstr, gt_txt, pr, pr_txt)
+        else:
+            gt_str_hit = pr_str_hit = set()
+        p_str = sum(rc in pr_str_hit for rc in pr_need_num) + sum(rc in pr_str_hit for rc in pr_need_txt)
+        r_str = sum(ec in gt_str_hit for ec in gt_need_num) + sum(ec in gt_str_hit for ec in gt_need_txt)
+    else:
+        # String candidates are only looked up in the length window the edit-distance rule allows
+        gt_txt_by_len, gt_by_len = _build_string_buckets(gt_txt), _build_string_buckets(gt)
+        pr_txt_by_len, pr_by_len = _build_string_buckets(pr_txt), _build_string_buckets(pr)
+        p_str = (sum(1 for rc in pr_need_num if _any_similar_expected(rc, gt_txt_by_len))
+                 + sum(1 for rc in pr_need_txt if _any_similar_expected(rc, gt_by_len)))
+        r_str = (sum(1 for ec in gt_need_num if _any_similar_result(ec, pr_txt_by_len))
+                 + sum(1 for ec in gt_need_txt if _any_similar_result(ec, pr_by_len)))
 
     # precision: for each predicted cell, does ANY expected cell match (±10% numeric or edit distance threshold)?
-    p_count = 0
-    for rc in pr:
-        if any(_cells_similar_default(ec, rc) for ec in gt):
-            p_count += 1
-    precision = p_count / len(pr)
-
+    precision = (len(shared) + sum(p_hits) + p_str) / len(pr)
     # recall: for each expected cell, does ANY predicted cell match?
-    r_count = 0
-    for ec in gt:
-        if any(_cells_similar_default(ec, rc) for rc in pr):
-            r_count += 1
-    recall = r_count / len(gt)
+    recall = (len(shared) + sum(r_hits) + r_str) / len(gt)
 
     return 0.0 if (precision + recall) == 0 else 2 * precision * recall / (precision + recall)
 
@@ -343,45 +535,35 @@ def cardinality(gt_rows, pr_rows) -> float:
     if se==0 or  sa==0: return 0.0
     return min(se, sa) / max(se, sa)
 
-def _normalize_rows_full(rows: List[List[Any]]) -> List[List[str]]:
-    return [[norm(v) for v in r] for r in rows]
-
-def _sort_by_second_cell(norm_rows: List[List[str]]) -> List[List[str]]:
-    return sorted(norm_rows, key=lambda r: (r[1] if len(r) > 1 else ""))
+def _norm_tuples(rows: List[List[Any]]) -> Iterable[Tuple[str, ...]]:
+    # normalized rows streamed straight into a Counter; interned cells make tuple __eq__ an identity check
+    n, intern = norm, sys.intern
+    return (tuple(intern(n(v)) for v in r) for r in rows)
 
 def tuple_constraint(gt_rows, pr_rows) -> float:
-    gt_nr = _sort_by_second_cell(_normalize_rows_full(gt_rows))
-    pr_nr = _sort_by_second_cell(_normalize_rows_full(pr_rows))
-    gt_count = Counter(tuple(r) for r in gt_nr)
-    pr_count = Counter(tuple(r) for r in pr_nr)
+    # multiset comparison: row order is irrelevant, so no sorting
+    gt_count = Counter(_norm_tuples(gt_rows))
+    pr_count = Counter(_norm_tuples(pr_rows))
     if not gt_count and not pr_count: return 1.0
     if not gt_count:                  return 0.0
-    good = 0
-    for row, c in gt_count.items():
-        good += 1 if pr_count.get(row, None) == c else 0
+    good = sum(1 for row, c in gt_count.items() if pr_count.get(row) == c)
     return good / len(gt_count)
 
-def tuple_similarity_constraint(gt_rows, pr_rows) -> float:
-    gt_nr = _normalize_rows_full(gt_rows)
-    pr_nr = _normalize_rows_full(pr_rows)
+def _rows_similar(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
+    # Uncached on purpose: row pairs rarely repeat, while the per-cell checks hit _cells_similar_default's cache
+    if len(a) != len(b): return False
+    for ai, bi in zip(a, b):
+        if ai != bi and not _cells_similar_default(ai, bi):
+            return False
+    return True
 
+def tuple_similarity_constraint(gt_rows, pr_rows) -> float:
     # multiplicity counters on tuples (order-sensitive)
-    gt_count = Counter(tuple(r) for r in gt_nr)
-    pr_count = Counter(tuple(r) for r in pr_nr)
+    gt_count = Counter(_norm_tuples(gt_rows))
+    pr_count = Counter(_norm_tuples(pr_rows))
     if not gt_count and not pr_count: return 1.0
     if not gt_count:                  return 0.0
 
-    @lru_cache(maxsize=200_000)
-    def rows_similar_cached(a: Tuple[str, ...], b: Tuple[str, ...]) -> bool:
-        if len(a) != len(b): return False
-        for i in range(len(a)):
-            ai, bi = a[i], b[i]
-            if ai == bi:
-                continue
-            if not _cells_similar_default(ai, bi):
-                return False
-        return True
-
     # bucket by (len(row), multiplicity)
     buckets: Dict[Tuple[int,int], List[Tuple[str,...]]] = defaultdict(list)
     for prow, pcnt in pr_count.items():
@@ -392,7 +574,7 @@ def tuple_similarity_constraint(gt_rows, pr_rows) -> float:
         candidates = buckets.get((len(erow), ecnt), [])
         found = False
         for prow in candidates:
-            if rows_similar_cached(tuple(erow), tuple(prow)):
+            if _rows_similar(erow, prow):
                 found = True
                 break
         if found:
@@ -428,19 +610,33 @@ def _eval_dataset_once(args):
 
     if not sub_dir:
         m = dict(F1=0.0, Card=0.0, TCon=0.0, AVG=0.0, n=0)
-        return dname, m, None, None
-
-    gt_files = {p.stem: p for p in gt_dir.glob("*") if p.suffix.lower() in (".csv",".json")}
+        return dname, m, None, None, {}  # no new normalizations: --norm-cache merges an empty dict
+
+    # one scandir pass: names come from the directory listing, no per-file stat
+    gt_files: Dict[str, Tuple[str, str]] = {}
+    with os.scandir(gt_dir) as it:
+        for e in it:
+            stem, ext = os.path.splitext(e.name)
+            if ext.lower() in (".csv", ".json"):
+                gt_files[stem] = (e.path, ext)
+    # the submission folder is listed once too; each query gets its resolved file (or None)
+    with os.scandir(sub_dir) as it:
+        sub_names = {e.name for e in it}
     tasks = []
-    for qid, gt_path in sorted(gt_files.items()):
-        tasks.append((qid, str(gt_path), str(sub_dir), gt_path.suffix, cell_mode, tuple_mode))
+    for qid, (gt_path, ext) in sorted(gt_files.items()):
+        name = qid + ext
+        if name not in sub_names:
+            name = qid + (".json" if ext.lower() == ".csv" else ".csv")
+        pr_path = os.path.join(sub_dir, name) if name in sub_names else None
+        tasks.append((qid, gt_path, pr_path, cell_mode, tuple_mode))
 
     results = []
     if jobs_queries > 1 and len(tasks) > 1:
-        with ProcessPoolExecutor(max_workers=jobs_queries) as ex:
-            futs = [ex.submit(_eval_query_once, t) for t in tasks]
-            for f in as_completed(futs):
-                results.append(f.result())
+        # chunked map: one pickle/IPC round-trip per chunk of queries instead of per query
+        chunk = max(1, len(tasks) // (jobs_queries * 4))
+        with ProcessPoolExecutor(max_workers=jobs_queries, initializer=_set_norm_cache,
+                                 initargs=(_NORM_CACHE,)) as ex:
+            results = list(ex.map(_eval_query_once, tasks, chunksize=chunk))
     else:
         for t in tasks:
             results.append(_eval_query_once(t))
@@ -448,7 +644,7 @@ def _eval_dataset_once(args):
     n = len(results)
     if n == 0:
         metrics = dict(F1=0.0, Card=0.0, TCon=0.0, AVG=0.0, n=0)
-        return dname, metrics, None, None
+        return dname, metrics, None, None, {}
 
     sF1 = sum(x[0] for x in results)
     sCard = sum(x[1] for x in results)
@@ -472,16 +668,20 @@ def _eval_dataset_once(args):
         AVG  = sAVG/n,
         n    = n
     )
-    return dname, metrics, d_tokens, d_avg_time
+    new_norms = _take_new_norms()  # this process' own, plus what the query workers sent back
+    if new_norms is not None:
+        for x in results:
+            new_norms.update(x[6])
+    return dname, metrics, d_tokens, d_avg_time, new_norms
 
 
 def find_dataset_dirs(root: Path, allow: Optional[Set[str]]) -> Dict[str, Path]:
     out: Dict[str, Path] = {}
-    for p in root.iterdir():
-        if p.is_dir():
-            name = p.name
-            if allow and name not in allow: continue
-            out[name] = p
+    with os.scandir(root) as it:  # DirEntry.is_dir() reuses the d_type from the listing
+        for e in it:
+            if allow and e.name not in allow: continue
+            if e.is_dir():
+                out[e.name] = Path(e.path)
     return out
 
 # -------- LaTeX output --------
@@ -528,7 +728,7 @@ def print_latex_table(rows: List[List[str]], headers: List[str],
         out.append(r"\end{table}")
     print("\n".join(out))
 
-def main():
+def main(argv: Optional[List[str]] = None):
     ap = argparse.ArgumentParser(description="GALOIS metrics (Java-faithful), per dataset, optimized.")
     ap.add_argument("--ground", required=True, type=Path)
     ap.add_argument("--submissions", required=True, type=Path)
@@ -544,7 +744,12 @@ def main():
     ap.add_argument("--overall", action="store_true", help="Aggregate across all selected datasets and print a single ALL row")
     ap.add_argument("--jobs", type=int, default=6, help="Parallelize across datasets (processes)")
     ap.add_argument("--jobs-queries", type=int, default=6, help="Parallelize queries within each dataset")
-    args = ap.parse_args()
+    ap.add_argument("--norm-cache", type=Path, default=None,
+                    help="JSON file keeping cell normalizations across runs (loaded at start, updated at the end)")
+    args = ap.parse_args(argv)
+
+    if args.norm_cache:
+        _set_norm_cache(load_norm_cache(args.norm_cache))
 
     allow = set(args.datasets) if args.datasets else None
     gt_dsets  = find_dataset_dirs(args.ground, allow)
@@ -565,7 +770,8 @@ def main():
 
     results = []
     if args.jobs > 1 and len(tasks) > 1:
-        with ProcessPoolExecutor(max_workers=args.jobs) as ex:
+        with ProcessPoolExecutor(max_workers=args.jobs, initializer=_set_norm_cache,
+                                 initargs=(_NORM_CACHE,)) as ex:
             fut2name = {ex.submit(_eval_dataset_once, t): t[0] for t in tasks}
             for fut in as_completed(fut2name):
                 results.append(fut.result())
@@ -582,7 +788,12 @@ def main():
     overall_time_weighted_sum: float = 0.0
     overall_time_weight_n: int = 0
 
-    for dname, m, d_tokens, d_avg_time in sorted(results, key=lambda x: x[0]):
+    if args.norm_cache:
+        for x in results:
+            _NORM_CACHE.update(x[4])
+        save_norm_cache(args.norm_cache, _NORM_CACHE)
+
+    for dname, m, d_tokens, d_avg_time, _ in sorted(results, key=lambda x: x[0]):
         tot_q += m["n"]
         sF1   += m["F1"]  * m["n"]
         sCard += m["Card"]* m["n"]
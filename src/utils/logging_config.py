@@ -3,7 +3,11 @@ from .constants import LOGS_DIR
 from pathlib import Path
 import sys, warnings
 
-def log_init() -> None:
+def log_init(level: str = "INFO") -> None:
+    """
+    Console sink at `level` (e.g. logging.level from config.yaml; WARNING silences per-query INFO),
+    file sink at DEBUG written by a background thread so callers never wait on disk I/O.
+    """
     LOGS_DIR.mkdir(parents=True, exist_ok=True)
     LOG_FILE = LOGS_DIR / "pipeline.log"
     
@@ -16,8 +20,10 @@ def log_init() -> None:
         format="<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | "
             "<level>{level: <8}</level> | "
             "<cyan>{message}</cyan>",
-        level="INFO",
+        level=level,
         colorize=True,
+        backtrace=False,
+        diagnose=False,
     )
 
     # 2️⃣ File output (persistent logs)
@@ -28,14 +34,17 @@ def log_init() -> None:
         compression="zip",        # compress old logs
         format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {message}",
         level="DEBUG",            # store all messages
+        enqueue=True,             # writes + rotation happen off the caller's thread
+        backtrace=False,
+        diagnose=False,
     )
 
 def log_query_event(event: str, **kwargs):
     """
     Helper to log structured events, e.g. dataset progress, latency, tokens, etc.
     """
-    context = " ".join(f"{k}={v}" for k, v in kwargs.items())
-    logger.info(f"{event} {context}")
+    # lazy: the key=value context is only formatted if INFO is actually emitted
+    logger.opt(lazy=True).info("{} {}", lambda: event, lambda: " ".join(f"{k}={v}" for k, v in kwargs.items()))
 
 def warning_to_loguru(message, category, filename, lineno, file=None, line=None):
     """Redirect Python warnings (e.g., DeprecationWarning) to loguru"""
@@ -10,30 +10,18 @@ import argparse, os, time, json, re
 from pathlib import Path
 import requests
 
+# Whole-line "--" comments (the line is dropped) and the statement separator,
+# which also swallows a trailing comment on the same line ("...; -- note")
+_COMMENT_LINE_RE = re.compile(r"^[^\S\n]*--[^\n]*(?:\n|\Z)", re.M)
+_STMT_SPLIT_RE = re.compile(r";(?:[^\S\n]*--[^\n]*)?")
+
 def read_sql_statements(path: Path):
-    text = path.read_text(encoding="utf-8")
-    # Remove simple -- line comments
-    lines = []
-    for line in text.splitlines():
-        if line.strip().startswith("--"):
-            continue
-        lines.append(line)
-    text = "\n".join(lines)
-    # Split on semicolons that end a statement
-    parts = [p.strip() for p in re.split(r';\s*(?:--.*)?\n', text) if p.strip()]
-    # Some files may not end with semicolon/newline; also split by ';' fallback
-    stmts = []
-    for p in parts:
-        for q in [s.strip() for s in p.split(';') if s.strip()]:
-            if q:
-                stmts.append(q)
-    # Deduplicate preserving order
-    out = []
-    seen = set()
-    for s in stmts:
-        if s not in seen:
-            seen.add(s)
-            out.append(s)
+    text = _COMMENT_LINE_RE.sub("", path.read_text(encoding="utf-8"))
+    # Split once on ";", deduplicate preserving order
+    out, seen = [], set()
+    for s in map(str.strip, _STMT_SPLIT_RE.split(text)):
+        if s and s not in seen:
+            seen.add(s); out.append(s)
     return out
 
 def find_dataset_dirs(data_root: Path):
@@ -0,0 +1,34 @@
+import json
+
+from src.utils import galois_eval
+
+
+def _write_json(path, obj):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(obj), encoding="utf-8")
+
+
+def test_norm_cache_with_dataset_without_submissions(tmp_path, capsys):
+    ground, subs, cache = tmp_path / "ground", tmp_path / "submissions", tmp_path / "norm_cache.json"
+    rows = [{"name": "Rome", "population": 2_800_000}, {"name": "Milan", "population": 1_400_000}]
+    _write_json(ground / "WORLD" / "query1.json", rows)
+    _write_json(ground / "GEO" / "query1.json", rows)  # no submissions/GEO folder
+    _write_json(subs / "WORLD" / "query1.json", rows)
+
+    try:
+        galois_eval.main([
+            "--ground", str(ground), "--submissions", str(subs), "--format", "json",
+            "--jobs", "1", "--jobs-queries", "1", "--norm-cache", str(cache),
+        ])
+    finally:
+        galois_eval._set_norm_cache(None)  # module state: keep other tests on the plain LRU
+
+    out = json.loads(capsys.readouterr().out)
+    assert out["WORLD"]["#Queries"] == 1 and out["GEO"]["#Queries"] == 0
+    entries = json.loads(cache.read_text(encoding="utf-8"))["entries"]
+    assert entries.get("Rome") == "rome"
+
+
+def test_read_submission_file_missing_path(tmp_path):
+    assert galois_eval.read_submission_file(None) == ([], [], None, None)
+    assert galois_eval.read_submission_file(tmp_path / "query1.json") == ([], [], None, None)
@@ -0,0 +1,12 @@
+from src.llm.llm_cache import is_deterministic
+
+
+def test_generate_params_default_to_greedy():
+    assert is_deterministic({"max_new_tokens": 200})
+    assert not is_deterministic({"decoding_method": "sample", "temperature": 0.7})
+
+
+def test_chat_params_need_temperature_zero():
+    assert is_deterministic({"max_tokens": 200, "temperature": 0}, chat=True)
+    assert not is_deterministic({"max_tokens": 200, "temperature": 0.7}, chat=True)
+    assert not is_deterministic({"max_tokens": 200}, chat=True)
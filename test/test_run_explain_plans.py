@@ -0,0 +1,90 @@
+import duckdb
+import pytest
+
+from src.db import duckdb_explain as dx
+from src.db import run_explain_plans as rep
+
+
+@pytest.fixture
+def dataset(tmp_path, monkeypatch):
+    """
+    A one-table TOY dataset; outputs, plan cache and memo are redirected into tmp_path.
+    Returns (dataset_dir, calls) where calls records every (sql, analyze) DuckDB actually ran.
+    """
+    ds = tmp_path / "data" / "TOY"
+    ds.mkdir(parents=True)
+    con = duckdb.connect(str(ds / "toy.duckdb"))
+    con.execute("CREATE TABLE t AS SELECT range AS id FROM range(10)")
+    con.close()
+    (ds / "queries_toy.sql").write_text("SELECT id FROM t WHERE id > 3;\n", encoding="utf-8")
+
+    monkeypatch.chdir(tmp_path)  # RESULTS_*_ROOT / PLAN_STORE_PATH are relative to the cwd
+    monkeypatch.setattr(dx, "PLAN_CACHE_DIR", tmp_path / "plan_cache")
+    monkeypatch.setattr(dx, "_PLAN_MEMO", {})
+    monkeypatch.setattr(rep, "RESULTS_ROOT", tmp_path / "results")
+
+    calls = []
+    explain_on = dx._explain_on
+
+    def _counting_explain_on(con, sql, analyze, params=None):
+        calls.append((sql, analyze))
+        return explain_on(con, sql, analyze, params)
+
+    monkeypatch.setattr(dx, "_explain_on", _counting_explain_on)
+    yield ds, calls
+    dx.close_connections()
+
+
+def test_force_runs_explain_and_analyze_again(dataset):
+    ds, calls = dataset
+    assert rep.process_dataset(ds) == 1
+    assert sorted(a for _, a in calls) == [False, True]
+
+    calls.clear()
+    assert rep.process_dataset(ds) == 0  # outputs up to date: skipped
+    assert calls == []
+
+    assert rep.process_dataset(ds, force=True) == 1
+    assert sorted(a for _, a in calls) == [False, True]  # not served from the plan cache
+
+
+def test_store_writes_no_plan_files(dataset, tmp_path):
+    ds, _ = dataset
+    assert rep.process_dataset(ds, store=True) == 1
+    assert not (tmp_path / dx.RESULTS_JSON_ROOT).exists()
+    assert not (tmp_path / dx.RESULTS_TXT_ROOT).exists()
+    con = duckdb.connect(str(tmp_path / dx.PLAN_STORE_PATH), read_only=True)
+    try:
+        variants = con.execute("SELECT variant FROM plans ORDER BY variant").fetchall()
+    finally:
+        con.close()
+    assert variants == [("analyze",), ("explain",)]
+
+
+def test_db_writable_after_processing(dataset):
+    ds, _ = dataset
+    assert rep.process_dataset(ds) == 1
+    con = duckdb.connect(str(ds / "toy.duckdb"))  # read-write: fails while a read-only handle is cached
+    try:
+        con.execute("INSERT INTO t VALUES (42)")
+    finally:
+        con.close()
+
+
+def test_explain_json_served_from_plan_cache(dataset, monkeypatch):
+    ds, _ = dataset
+    cursors = []
+    cursor = dx._cursor
+    monkeypatch.setattr(dx, "_cursor", lambda db: cursors.append(db) or cursor(db))
+
+    first = dx.get_explain_json(ds / "toy.duckdb", "SELECT id FROM t WHERE id > 3")
+    assert len(cursors) == 1
+    assert dx.get_explain_json(ds / "toy.duckdb", "select id\n  from t where id > 3;") == first
+    assert len(cursors) == 1  # reformatted statement hits the canonical entry
+
+
+def test_plan_memo_is_bounded(dataset, monkeypatch):
+    monkeypatch.setattr(dx, "_PLAN_MEMO_MAX", 2)
+    for k in range(3):
+        dx._memo_put(dx.PLAN_CACHE_DIR / f"{k}.txt", str(k))
+    assert list(dx._PLAN_MEMO.values()) == ["1", "2"]
@@ -0,0 +1,38 @@
+from src.db.sql_splitter import iter_sql_statements
+
+
+def split(text):
+    return list(iter_sql_statements(text))
+
+
+def test_plain_statements():
+    assert split("SELECT 1; SELECT 2;\n") == ["SELECT 1", "SELECT 2"]
+    assert split("SELECT 1") == ["SELECT 1"]  # no trailing semicolon
+
+
+def test_semicolon_inside_quotes():
+    assert split("SELECT 'a;b'; SELECT \"x;y\" FROM t;") == ["SELECT 'a;b'", 'SELECT "x;y" FROM t']
+
+
+def test_doubled_quote_escapes():
+    assert split("SELECT 'it''s;here'; SELECT 2;") == ["SELECT 'it''s;here'", "SELECT 2"]
+    assert split('SELECT "a"";b"; SELECT 2') == ['SELECT "a"";b"', "SELECT 2"]
+
+
+def test_semicolon_inside_comments():
+    text = "SELECT 1 -- not; the end\n; SELECT /* still; one */ 2;"
+    assert split(text) == ["SELECT 1 -- not; the end", "SELECT /* still; one */ 2"]
+
+
+def test_comment_only_tail_is_skipped():
+    assert split("SELECT 1;\n-- trailing; note\n/* done; */\n") == ["SELECT 1"]
+
+
+def test_empty_chunks_are_skipped():
+    assert split(";;;") == []
+    assert split("SELECT 1;;; ;\n;SELECT 2;") == ["SELECT 1", "SELECT 2"]
+
+
+def test_unterminated_literal_and_comment_run_to_the_end():
+    assert split("SELECT 1; SELECT 'abc; def") == ["SELECT 1", "SELECT 'abc; def"]
+    assert split("SELECT 1; SELECT 2 /* open; comment") == ["SELECT 1", "SELECT 2 /* open; comment"]